@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-15 13:41
+
+from django.db import migrations, models
+import utils.uuid7
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '20251129072609_alter_candidate_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='role',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='candidate',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+    ]
@@ -1,17 +1,21 @@
-import uuid
-import random
-import string
+import hmac
 import os
-from django.db import models
+import time
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import timezone
 from datetime import timedelta
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from utils.crypto_utils import PasswordCrypto
+from utils.model_str import loaded_str
+from utils.uuid7 import uuid7
 
 
 class Role(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=50, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -21,7 +25,31 @@ class Role(models.Model):
         ordering = ['name']
 
     def __str__(self):
-        return self.name
+        return loaded_str(self)
+
+
+# Roles are looked up on most requests but change almost never; the version key keeps
+# every process's lookups in step and the timeout bounds anything a rollback leaves behind
+ROLE_CACHE_VERSION_KEY = 'auth:role_version'
+ROLE_CACHE_TIMEOUT = 300
+
+
+def get_role(name):
+    """Get a role by name, cached in the shared cache since roles rarely change"""
+    version = cache.get_or_set(ROLE_CACHE_VERSION_KEY, time.time_ns, None)
+    key = f'auth:role:{version}:{name.lower()}'
+    role = cache.get(key)
+    if role is None:
+        role = Role.objects.get(name__iexact=name)
+        cache.set(key, role, ROLE_CACHE_TIMEOUT)
+    return role
+
+
+@receiver([post_save, post_delete], sender=Role)
+def clear_role_cache(sender, **kwargs):
+    # A fresh timestamp so renamed or deleted roles are never served from an older key.
+    # Replaced on commit, so a lookup before then never caches the old row under it
+    transaction.on_commit(lambda: cache.set(ROLE_CACHE_VERSION_KEY, time.time_ns(), None))
 
 
 class UserManager(BaseUserManager):
@@ -49,7 +77,7 @@ class UserManager(BaseUserManager):
 
 class User(AbstractBaseUser, PermissionsMixin):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     email = models.EmailField(unique=True)
     role = models.ForeignKey(Role, on_delete=models.SET_NULL, null=True, blank=True, related_name='users')
     organization = models.ForeignKey(
@@ -81,7 +109,12 @@ class User(AbstractBaseUser, PermissionsMixin):
         ordering = ['-created_at']
 
     def __str__(self):
-        return self.email
+        return loaded_str(self, 'email')
+
+    @property
+    def role_name(self):
+        """Lower-cased role name, or an empty string when the user has no role"""
+        return self.role.name.lower() if self.role else ''
 
     def create_password(self, password):
         if not self.salt:
@@ -91,13 +124,19 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.password
 
     def check_password(self, password):
-        return PasswordCrypto.verify_password(password, self.password, self.salt)
+        if not PasswordCrypto.verify_password(password, self.password, self.salt):
+            return False
+        # Upgrade legacy sha256 hashes to the current scheme on the next successful login
+        if PasswordCrypto.needs_rehash(self.password):
+            self.password = PasswordCrypto.hash_password(password, self.salt)
+            self.save(update_fields=['password'])
+        return True
 
 
 
 class Candidate(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     first_name = models.CharField(max_length=255)
     last_name = models.CharField(max_length=255)
     email = models.EmailField(unique=True)
@@ -121,14 +160,11 @@ class Candidate(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return self.email
+        return loaded_str(self, 'email')
 
     @staticmethod
     def generate_random_password():
-        # return a 8 character random password with letters and digits
-        random_password = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
-        print(f'Random password: {random_password}')
-        return random_password
+        return PasswordCrypto.generate_random_password()
 
     def set_candidate_password(self, password):
         if not password:
@@ -154,7 +190,7 @@ class Candidate(models.Model):
             return False
         try:
             decrypted_password = PasswordCrypto.decrypt_password(self.password, self.salt)
-            return decrypted_password == password
+            return hmac.compare_digest(decrypted_password.encode('utf-8'), password.encode('utf-8'))
         except Exception:
             try:
                 return PasswordCrypto.verify_password(password, self.password, self.salt)
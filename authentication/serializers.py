@@ -1,7 +1,7 @@
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.utils import timezone
-from .models import User, Role, Candidate
+from .models import User, Role, Candidate, get_role
 
 
 class RoleSerializer(serializers.ModelSerializer):
@@ -34,7 +34,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         password = validated_data.pop('password')
         try:
-            admin_role = Role.objects.get(name__iexact='admin')
+            admin_role = get_role('admin')
         except Role.DoesNotExist:
             raise serializers.ValidationError({'role': 'Admin role does not exist. Please run create_roles command.'})
         
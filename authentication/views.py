@@ -86,7 +86,7 @@ class RegisterCandidateView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
         
-        role_name = request.user.role.name.lower()
+        role_name = request.user.role_name
         if role_name not in ['admin', 'hr']:
             return ApiResponseBuilder.error(
                 'Only admin or HR can register candidates',
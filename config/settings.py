@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'corsheaders',
@@ -87,6 +88,7 @@ ASGI_APPLICATION = 'config.asgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# PostgreSQL 15+ is required: question pool uniqueness uses NULLS NOT DISTINCT
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -148,7 +150,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.authentication.RoleAwareJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -191,6 +193,12 @@ CORS_ALLOW_ALL_ORIGINS = DEBUG  # Allow all origins in development
 OLLAMA_BASE_URL = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
 OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama3.2')
 OLLAMA_TIMEOUT = int(os.getenv('OLLAMA_TIMEOUT', '300'))
+OLLAMA_CONCURRENCY = int(os.getenv('OLLAMA_CONCURRENCY', '4'))
+
+# Report downloads
+# When set (e.g. '/protected/'), report PDFs are handed off to nginx via X-Accel-Redirect
+# instead of being streamed through the Django worker. Leave empty to serve them directly.
+REPORTS_ACCEL_REDIRECT_PREFIX = os.getenv('REPORTS_ACCEL_REDIRECT_PREFIX', '')
 
 # Channels Configuration
 CHANNEL_LAYERS = {
@@ -202,6 +210,14 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Cache Configuration
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('CACHE_URL', f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{os.getenv('REDIS_PORT', 6379)}/1"),
+    }
+}
+
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
@@ -215,3 +231,7 @@ CELERY_WORKER_SEND_TASK_EVENTS = True
 CELERY_TASK_SEND_SENT_EVENT = True
 CELERY_WORKER_PIDFILE = None 
 CELERY_BEAT_SCHEDULE_FILENAME = None
+# Long-running LLM generation gets its own workers so it never delays interview tasks
+CELERY_TASK_ROUTES = {
+    'questionbank.tasks.generate_questions': {'queue': 'question_generation'},
+}
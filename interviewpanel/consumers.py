@@ -300,7 +300,7 @@ class InterviewConsumer(AsyncWebsocketConsumer):
             return InterviewPanelCandidate.objects.select_related(
                 'interview_panel', 'candidate'
             ).get(
-                token=self.token,
+                token_hash=InterviewPanelCandidate.hash_token(self.token),
                 is_deleted=False,
                 is_active=True
             )
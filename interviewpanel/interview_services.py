@@ -86,16 +86,7 @@ class AnswerAnalysisService:
             expected_keywords_coverage = question.expected_keywords_coverage or 0.1
             expected_time_in_seconds = question.expected_time_in_seconds or 60
             ideal_answer_summary = question.ideal_answer_summary or ""
-            score_weight_technical = question.score_weight_technical or 0.5
-            score_weight_domain_knowledge = question.score_weight_domain_knowledge or 0.3
-            score_weight_communication = question.score_weight_communication or 0.1
-            score_weight_problem_solving = question.score_weight_problem_solving or 0.05
-            score_weight_creativity = question.score_weight_creativity or 0.05
-            score_weight_attention_to_detail = question.score_weight_attention_to_detail or 0.05
-            score_weight_time_management = question.score_weight_time_management or 0.05
-            score_weight_stress_management = question.score_weight_stress_management or 0.05
-            score_weight_adaptability = question.score_weight_adaptability or 0.05
-            score_weight_confidence = question.score_weight_confidence or 0.05
+            weights = question.score_weights
             
             # Calculate time taken in seconds
             if answer.time_taken_in_seconds and answer.time_taken_in_seconds > 0:
@@ -120,16 +111,7 @@ class AnswerAnalysisService:
                 expected_time_in_seconds=expected_time_in_seconds,
                 ideal_answer_summary=ideal_answer_summary,
                 total_time_taken_in_seconds=total_time_taken_in_seconds,
-                score_weight_technical=score_weight_technical,
-                score_weight_domain_knowledge=score_weight_domain_knowledge,
-                score_weight_communication=score_weight_communication,
-                score_weight_problem_solving=score_weight_problem_solving,
-                score_weight_creativity=score_weight_creativity,
-                score_weight_attention_to_detail=score_weight_attention_to_detail,
-                score_weight_time_management=score_weight_time_management,
-                score_weight_stress_management=score_weight_stress_management,
-                score_weight_adaptability=score_weight_adaptability,
-                score_weight_confidence=score_weight_confidence
+                **{f'score_weight_{skill}': weight for skill, weight in weights.items()}
             )
 
             data = {
@@ -174,19 +156,6 @@ class AnswerAnalysisService:
 
             scores = ScoreCalculator.validate_analysis_scores(analysis)
 
-            weights = {
-                'technical': question.score_weight_technical or 0.5,
-                'domain_knowledge': question.score_weight_domain_knowledge or 0.3,
-                'communication': question.score_weight_communication or 0.1,
-                'problem_solving': question.score_weight_problem_solving or 0.05,
-                'creativity': question.score_weight_creativity or 0.05,
-                'attention_to_detail': question.score_weight_attention_to_detail or 0.05,
-                'time_management': question.score_weight_time_management or 0.05,
-                'stress_management': question.score_weight_stress_management or 0.05,
-                'adaptability': question.score_weight_adaptability or 0.05,
-                'confidence': question.score_weight_confidence or 0.05,
-            }
-
             total_score = ScoreCalculator.calculate_weighted_score(
                 scores=scores,
                 weights=weights,
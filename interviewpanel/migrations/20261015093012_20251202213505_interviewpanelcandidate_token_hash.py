@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-15 09:30
+
+import hashlib
+from django.db import migrations, models
+
+
+def backfill_token_hash(apps, schema_editor):
+    InterviewPanelCandidate = apps.get_model('interviewpanel', 'InterviewPanelCandidate')
+    candidates = list(InterviewPanelCandidate.objects.filter(token__isnull=False).only('id', 'token'))
+    for candidate in candidates:
+        candidate.token_hash = hashlib.sha256(candidate.token.encode('utf-8')).hexdigest()
+    InterviewPanelCandidate.objects.bulk_update(candidates, ['token_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviewpanel', '20251202213504_20251203000001_interviewreportanswerwisefeedback'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewpanelcandidate',
+            name='token_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_token_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-15 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviewpanel', '20261015093012_20251202213505_interviewpanelcandidate_token_hash'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='interviewpanelquestiondistribution',
+            name='number_of_questions',
+        ),
+        migrations.AddField(
+            model_name='interviewpanelquestiondistribution',
+            name='number_of_questions',
+            field=models.GeneratedField(db_persist=True, expression=models.F('number_of_easy_questions') + models.F('number_of_medium_questions') + models.F('number_of_hard_questions'), output_field=models.IntegerField()),
+        ),
+    ]
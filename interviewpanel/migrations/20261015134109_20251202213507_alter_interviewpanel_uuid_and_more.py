@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-15 13:41
+
+from django.db import migrations, models
+import utils.uuid7
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviewpanel', '20261015101544_20251202213506_alter_interviewpanelquestiondistribution_number_of_questions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='interviewpanel',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='interviewpanelquestiondistribution',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='interviewpanelquestion',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='interviewpanelcandidate',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='interviewsession',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='interviewanswer',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='interviewreportanswerwisefeedback',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+    ]
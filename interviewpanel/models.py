@@ -5,13 +5,14 @@ from questionbank.models import Category, Topic, Subtopic, Question
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
-import uuid
-import random
-import string
+import hashlib
+import secrets
+from utils.model_str import loaded_str
+from utils.uuid7 import uuid7
 
 class InterviewPanel(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
     total_number_of_questions = models.IntegerField(default=0)
@@ -34,12 +35,15 @@ class InterviewPanel(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return self.name
+        return loaded_str(self)
 
     def check_and_deactivate(self):
+        # Updates this instance in place and returns is_active, so callers never
+        # need a refresh_from_db afterwards
         if self.end_datetime < timezone.now() and self.is_active:
             self.is_active = False
             self.save(update_fields=['is_active'])
+        return self.is_active
 
 @receiver(pre_save, sender=InterviewPanel)
 def check_panel_expiry(sender, instance, **kwargs):
@@ -49,12 +53,16 @@ def check_panel_expiry(sender, instance, **kwargs):
 # category / topic / subtopic wise questions distribution
 class InterviewPanelQuestionDistribution(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     interview_panel = models.ForeignKey(InterviewPanel, on_delete=models.CASCADE, related_name='interview_panel_question_distributions')
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='interview_panel_question_distributions')
     topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='interview_panel_question_distributions')
     subtopic = models.ForeignKey(Subtopic, on_delete=models.CASCADE, related_name='interview_panel_question_distributions')
-    number_of_questions = models.IntegerField(default=0)
+    number_of_questions = models.GeneratedField(
+        expression=models.F('number_of_easy_questions') + models.F('number_of_medium_questions') + models.F('number_of_hard_questions'),
+        output_field=models.IntegerField(),
+        db_persist=True
+    )
     number_of_hard_questions = models.IntegerField(default=0)
     number_of_medium_questions = models.IntegerField(default=0)
     number_of_easy_questions = models.IntegerField(default=0)
@@ -77,7 +85,7 @@ class InterviewPanelQuestionDistribution(models.Model):
 # interview panel question
 class InterviewPanelQuestion(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     interview_panel = models.ForeignKey(InterviewPanel, on_delete=models.CASCADE, related_name='interview_panel_questions')
     question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name='interview_panel_questions')
     is_active = models.BooleanField(default=True)
@@ -94,14 +102,15 @@ class InterviewPanelQuestion(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return self.question.name
+        return loaded_str(self, 'question.name')
 
 class InterviewPanelCandidate(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     interview_panel = models.ForeignKey(InterviewPanel, on_delete=models.CASCADE, related_name='interview_panel_candidates')
     candidate = models.ForeignKey(Candidate, on_delete=models.CASCADE, related_name='interview_panel_candidates')
     token = models.CharField(max_length=255, null=True, blank=True)
+    token_hash = models.CharField(max_length=64, unique=True, null=True, blank=True, editable=False)
     token_expires_at = models.DateTimeField(null=True, blank=True)
     score = models.IntegerField(default=0)
     total_time_taken_in_seconds = models.IntegerField(default=0)
@@ -123,10 +132,20 @@ class InterviewPanelCandidate(models.Model):
     def __str__(self):
         return f"{self.candidate.first_name} {self.candidate.last_name}"
 
-    def generate_token(self):
-        self.token = ''.join(random.choices(string.ascii_letters + string.digits, k=32))
+    @staticmethod
+    def new_token():
+        # 24 random bytes -> 32 url-safe characters
+        return secrets.token_urlsafe(24)
+
+    @staticmethod
+    def hash_token(token):
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def assign_token(self):
+        # Lookups go through the indexed token_hash column, never the raw token
+        self.token = self.new_token()
+        self.token_hash = self.hash_token(self.token)
         self.token_expires_at = self.interview_panel.end_datetime
-        self.save()
         return self.token
 
 class InterviewSession(models.Model):
@@ -139,7 +158,7 @@ class InterviewSession(models.Model):
     ]
     
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     interview_panel_candidate = models.OneToOneField(
         InterviewPanelCandidate,
         on_delete=models.CASCADE,
@@ -182,7 +201,7 @@ class InterviewAnswer(models.Model):
     ]
     
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     interview_session = models.ForeignKey(
         InterviewSession,
         on_delete=models.CASCADE,
@@ -243,7 +262,7 @@ class InterviewAnswer(models.Model):
 
 class InterviewReportAnswerwiseFeedback(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     interview_session = models.ForeignKey(InterviewSession, on_delete=models.CASCADE, related_name='interview_session_answerwise_feedbacks')
     answer = models.ForeignKey(InterviewAnswer, on_delete=models.CASCADE, related_name='interview_session_answerwise_feedbacks')
     feedback = models.TextField(blank=True, null=True)
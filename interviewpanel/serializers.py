@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import InterviewPanel, InterviewPanelQuestionDistribution, InterviewPanelQuestion, InterviewPanelCandidate, InterviewSession, InterviewAnswer, InterviewReportAnswerwiseFeedback
+from django.db.models import Prefetch
+from .models import InterviewPanel, InterviewPanelQuestionDistribution, InterviewPanelQuestion, InterviewPanelCandidate, InterviewAnswer, InterviewReportAnswerwiseFeedback
 from questionbank.models import Category, Topic, Subtopic, Question
 from authentication.models import Candidate
 
@@ -88,10 +89,12 @@ class InterviewPanelCreateSerializer(serializers.Serializer):
         if not organization:
             return value
         
+        found_uuids = set(Candidate.objects.filter(
+            uuid__in=value,
+            organization=organization
+        ).values_list('uuid', flat=True))
         for candidate_uuid in value:
-            try:
-                candidate = Candidate.objects.get(uuid=candidate_uuid, organization=organization)
-            except Candidate.DoesNotExist:
+            if candidate_uuid not in found_uuids:
                 raise serializers.ValidationError(f"Candidate {candidate_uuid} not found in organization")
         
         return value
@@ -114,8 +117,32 @@ class InterviewPanelSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['uuid', 'created_at', 'updated_at', 'organization']
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Prefetch the distributions and candidates read by the method fields"""
+        return queryset.prefetch_related(
+            Prefetch(
+                'interview_panel_question_distributions',
+                queryset=InterviewPanelQuestionDistribution.objects.filter(
+                    is_deleted=False
+                ).select_related('category', 'topic', 'subtopic'),
+                to_attr='active_question_distributions'
+            ),
+            Prefetch(
+                'interview_panel_candidates',
+                queryset=InterviewPanelCandidate.objects.filter(
+                    is_deleted=False
+                ).select_related('candidate', 'interview_session'),
+                to_attr='active_candidates'
+            )
+        )
+
     def get_question_distributions(self, obj):
-        distributions = obj.interview_panel_question_distributions.filter(is_deleted=False)
+        distributions = getattr(obj, 'active_question_distributions', None)
+        if distributions is None:
+            distributions = obj.interview_panel_question_distributions.filter(
+                is_deleted=False
+            ).select_related('category', 'topic', 'subtopic')
         return [{
             'uuid': dist.uuid,
             'category': dist.category.name,
@@ -128,21 +155,22 @@ class InterviewPanelSerializer(serializers.ModelSerializer):
         } for dist in distributions]
 
     def get_candidates(self, obj):
-        candidates = obj.interview_panel_candidates.filter(is_deleted=False)
+        candidates = getattr(obj, 'active_candidates', None)
+        if candidates is None:
+            candidates = obj.interview_panel_candidates.filter(
+                is_deleted=False
+            ).select_related('candidate', 'interview_session')
         candidates_data = []
         for cand in candidates:
-            try:
-                session = InterviewSession.objects.get(
-                    interview_panel_candidate=cand,
-                    is_deleted=False
-                )
+            session = getattr(cand, 'interview_session', None)
+            if session is not None and not session.is_deleted:
                 status = session.status
                 started_at = session.started_at
                 completed_at = session.completed_at
                 cumulative_score = session.cumulative_score
                 has_report = session.status == 'completed' and bool(session.report_pdf_path)
                 session_uuid = str(session.uuid)
-            except InterviewSession.DoesNotExist:
+            else:
                 status = 'pending'
                 started_at = None
                 completed_at = None
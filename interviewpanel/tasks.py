@@ -20,6 +20,7 @@ from utils.exceptions import (
     QuestionSelectionError
 )
 from utils.prompt_sanitizer import PromptSanitizer
+from questionbank.models import Question
 from questionbank.ollama_service import OllamaService
 from datetime import datetime
 import os
@@ -590,9 +591,8 @@ def select_and_send_next_question(session_uuid, next_action, attempt_count=0):
             
             return {'status': 'completed', 'message': 'No more questions'}
         
-        # Refresh question object to ensure we have latest data
-        question = next_question_obj.question
-        question.refresh_from_db()
+        # Reload the question with its taxonomy in one query for the payload below
+        question = Question.objects.with_taxonomy().get(pk=next_question_obj.question_id)
         
         # Get question text - the Question model has 'question' field for the actual question text
         question_text = question.question.strip() if question.question else ""
@@ -1,13 +1,16 @@
 from rest_framework import status, permissions
 from rest_framework.views import APIView
+from rest_framework.pagination import CursorPagination
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.db import transaction
+from django.db.models import Prefetch, Avg, F, Window
+from django.db.models.functions import Coalesce, Random, RowNumber
 from django.utils import timezone
-from django.http import FileResponse
+from django.http import FileResponse, HttpResponse
 from django.conf import settings
-from pathlib import Path
-import random
+import os
+import functools
 from utils.api_response import ApiResponseBuilder
 from organizations.permissions import IsAdminOrHr
 from .models import InterviewPanel, InterviewPanelQuestionDistribution, InterviewPanelQuestion, InterviewPanelCandidate, InterviewSession, InterviewAnswer, InterviewReportAnswerwiseFeedback
@@ -15,18 +18,56 @@ from .serializers import InterviewPanelCreateSerializer, InterviewPanelUpdateSer
 from questionbank.models import Category, Topic, Subtopic, Question
 from authentication.models import Candidate
 
+BULK_CREATE_BATCH_SIZE = 1000
+DIFFICULTY_LEVELS = ('easy', 'medium', 'hard')
+
+# Cursor pagination for the panel list
+class InterviewPanelCursorPagination(CursorPagination):
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
+
+def with_interview_panel(only=None):
+    """
+    Resolve the panel uuid from the URL and hand the organization's panel to the handler.
+    
+    Handlers that never serialize the panel can pass only= to skip loading large
+    columns such as the description.
+    """
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(self, request, interview_panel_uuid=None, **kwargs):
+            if not interview_panel_uuid:
+                return ApiResponseBuilder.error(
+                    'Interview panel UUID is required',
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            queryset = InterviewPanel.objects.all()
+            if only:
+                queryset = queryset.only(*only)
+            try:
+                interview_panel = queryset.get(
+                    uuid=interview_panel_uuid,
+                    organization=request.user.organization,
+                    is_deleted=False
+                )
+            except InterviewPanel.DoesNotExist:
+                return ApiResponseBuilder.error(
+                    'Interview panel not found',
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            
+            return view_method(self, request, interview_panel)
+        return wrapper
+    return decorator
+
 @method_decorator(csrf_exempt, name='dispatch')
 class InterviewPanelView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsAdminOrHr]
     
-    def post(self, request):        
-        role_name = request.user.role.name.lower()
-        if role_name not in ['admin', 'hr']:
-            return ApiResponseBuilder.error(
-                'Only admin and HR users can create interview panels',
-                status_code=status.HTTP_403_FORBIDDEN
-            )
-        
+    def post(self, request):
         serializer = InterviewPanelCreateSerializer(
             data=request.data,
             context={'request': request, 'organization': request.user.organization}
@@ -61,108 +102,89 @@ class InterviewPanelView(APIView):
                 updated_by=request.user
             )
             
-            for dist_data in validated_data['question_distributions']:
-                topic = Topic.objects.get(uuid=dist_data['topic_uuid'])
-                subtopic = Subtopic.objects.get(uuid=dist_data['subtopic_uuid'])
-                
-                total_questions = dist_data['easy'] + dist_data['medium'] + dist_data['hard']
+            question_distributions = []
+            panel_questions = []
+            # Picks only need to be unique within this new panel, so concurrent
+            # panel creations cannot collide and no lock on the pool is taken
+            selected_question_ids = set()
+            
+            distributions = validated_data['question_distributions']
+            topics = Topic.objects.in_bulk(
+                {dist_data['topic_uuid'] for dist_data in distributions},
+                field_name='uuid'
+            )
+            subtopics = Subtopic.objects.in_bulk(
+                {dist_data['subtopic_uuid'] for dist_data in distributions},
+                field_name='uuid'
+            )
+            
+            for dist_data in distributions:
+                topic = topics[dist_data['topic_uuid']]
+                subtopic = subtopics[dist_data['subtopic_uuid']]
                 
-                question_distribution = InterviewPanelQuestionDistribution.objects.create(
+                question_distributions.append(InterviewPanelQuestionDistribution(
                     interview_panel=interview_panel,
                     category=category,
                     topic=topic,
                     subtopic=subtopic,
-                    number_of_questions=total_questions,
                     number_of_easy_questions=dist_data['easy'],
                     number_of_medium_questions=dist_data['medium'],
                     number_of_hard_questions=dist_data['hard'],
                     created_by=request.user,
                     updated_by=request.user
-                )
-                existing_question_ids = set(
-                    InterviewPanelQuestion.objects.filter(
-                        interview_panel=interview_panel
-                    ).values_list('question_id', flat=True)
-                )
+                ))
                 
-                if dist_data['easy'] > 0:
-                    easy_questions = list(Question.objects.filter(
-                        category=category,
-                        topic=topic,
-                        subtopic=subtopic,
-                        difficulty_level='easy'
-                    ).exclude(id__in=existing_question_ids).values_list('id', flat=True))
-                    
-                    available_easy_count = len(easy_questions)
-                    if available_easy_count > 0:
-                        num_to_select = min(dist_data['easy'], available_easy_count)
-                        selected_easy = random.sample(easy_questions, num_to_select)
-                        for question_id in selected_easy:
-                            InterviewPanelQuestion.objects.create(
-                                interview_panel=interview_panel,
-                                question_id=question_id,
-                                created_by=request.user,
-                                updated_by=request.user
-                            )
-                            existing_question_ids.add(question_id)
+                levels = [level for level in DIFFICULTY_LEVELS if dist_data[level] > 0]
+                if not levels:
+                    continue
                 
-                if dist_data['medium'] > 0:
-                    medium_questions = list(Question.objects.filter(
-                        category=category,
-                        topic=topic,
-                        subtopic=subtopic,
-                        difficulty_level='medium'
-                    ).exclude(id__in=existing_question_ids).values_list('id', flat=True))
-                    
-                    available_medium_count = len(medium_questions)
-                    if available_medium_count > 0:
-                        num_to_select = min(dist_data['medium'], available_medium_count)
-                        selected_medium = random.sample(medium_questions, num_to_select)
-                        
-                        for question_id in selected_medium:
-                            InterviewPanelQuestion.objects.create(
-                                interview_panel=interview_panel,
-                                question_id=question_id,
-                                created_by=request.user,
-                                updated_by=request.user
-                            )
-                            existing_question_ids.add(question_id)
+                # Shuffle each difficulty level in the database and keep only the
+                # first n rows per level, so just the picked ids come back
+                picked = Question.objects.filter(
+                    category=category,
+                    topic=topic,
+                    subtopic=subtopic,
+                    difficulty_level__in=levels
+                ).exclude(id__in=selected_question_ids).annotate(
+                    pick=Window(
+                        expression=RowNumber(),
+                        partition_by=[F('difficulty_level')],
+                        order_by=Random()
+                    )
+                ).filter(
+                    pick__lte=max(dist_data[level] for level in levels)
+                ).values_list('id', 'difficulty_level', 'pick')
                 
-                if dist_data['hard'] > 0:
-                    hard_questions = list(Question.objects.filter(
-                        category=category,
-                        topic=topic,
-                        subtopic=subtopic,
-                        difficulty_level='hard'
-                    ).exclude(id__in=existing_question_ids).values_list('id', flat=True))
-                    
-                    available_hard_count = len(hard_questions)
-                    if available_hard_count > 0:
-                        num_to_select = min(dist_data['hard'], available_hard_count)
-                        selected_hard = random.sample(hard_questions, num_to_select)
-                        
-                        for question_id in selected_hard:
-                            InterviewPanelQuestion.objects.create(
-                                interview_panel=interview_panel,
-                                question_id=question_id,
-                                created_by=request.user,
-                                updated_by=request.user
-                            )
-                            existing_question_ids.add(question_id)
+                for question_id, difficulty_level, pick in picked:
+                    if pick <= dist_data[difficulty_level]:
+                        panel_questions.append(InterviewPanelQuestion(
+                            interview_panel=interview_panel,
+                            question_id=question_id,
+                            created_by=request.user,
+                            updated_by=request.user
+                        ))
+                        selected_question_ids.add(question_id)
+            
+            InterviewPanelQuestionDistribution.objects.bulk_create(question_distributions, batch_size=BULK_CREATE_BATCH_SIZE)
+            InterviewPanelQuestion.objects.bulk_create(panel_questions, batch_size=BULK_CREATE_BATCH_SIZE)
             
             candidate_uuids = validated_data.get('candidate_uuids', [])
-            for candidate_uuid in candidate_uuids:
-                try:
-                    candidate = Candidate.objects.get(uuid=candidate_uuid, organization=request.user.organization)
-                    panel_candidate = InterviewPanelCandidate.objects.create(
+            if candidate_uuids:
+                candidates = Candidate.objects.filter(
+                    organization=request.user.organization
+                ).in_bulk(candidate_uuids, field_name='uuid')
+                panel_candidates = []
+                for candidate_uuid in dict.fromkeys(candidate_uuids):
+                    candidate = candidates.get(candidate_uuid)
+                    if candidate is None:
+                        continue
+                    panel_candidate = InterviewPanelCandidate(
                         interview_panel=interview_panel,
                         candidate=candidate
                     )
-                    panel_candidate.generate_token()
-                except Candidate.DoesNotExist:
-                    continue
-        
-        interview_panel.check_and_deactivate()
+                    panel_candidate.assign_token()
+                    panel_candidates.append(panel_candidate)
+                InterviewPanelCandidate.objects.bulk_create(panel_candidates, batch_size=BULK_CREATE_BATCH_SIZE)
         
         return ApiResponseBuilder.success(
             'Interview panel created successfully',
@@ -181,13 +203,14 @@ class InterviewPanelView(APIView):
         
         if interview_panel_uuid:
             try:
-                interview_panel = InterviewPanel.objects.get(
+                interview_panel = InterviewPanelSerializer.setup_eager_loading(
+                    InterviewPanel.objects.all()
+                ).get(
                     uuid=interview_panel_uuid,
                     organization=request.user.organization,
                     is_deleted=False
                 )
                 interview_panel.check_and_deactivate()
-                interview_panel.refresh_from_db()
                 
                 return ApiResponseBuilder.success(
                     'Interview panel retrieved successfully',
@@ -202,15 +225,29 @@ class InterviewPanelView(APIView):
             interview_panels = InterviewPanel.objects.filter(
                 organization=request.user.organization,
                 is_deleted=False
-            ).order_by('-created_at')
-            
-            for panel in interview_panels:
-                panel.check_and_deactivate()
+            )
+            interview_panels.filter(
+                is_active=True,
+                end_datetime__lt=timezone.now()
+            ).update(is_active=False)
+
+            interview_panels = InterviewPanelSerializer.setup_eager_loading(
+                interview_panels.order_by('-created_at')
+            )
             
-            interview_panels = InterviewPanel.objects.filter(
-                organization=request.user.organization,
-                is_deleted=False
-            ).order_by('-created_at')
+            # Keyset pages only when the client asks for page_size, otherwise the full list
+            paginator = InterviewPanelCursorPagination()
+            page = paginator.paginate_queryset(interview_panels, request, view=self)
+            if page is not None:
+                serializer = InterviewPanelSerializer(page, many=True)
+                return ApiResponseBuilder.success(
+                    'Interview panels retrieved successfully',
+                    {
+                        'interview_panels': serializer.data,
+                        'next_page': paginator.get_next_link(),
+                        'previous_page': paginator.get_previous_link()
+                    }
+                )
             
             serializer = InterviewPanelSerializer(interview_panels, many=True)
             return ApiResponseBuilder.success(
@@ -218,44 +255,9 @@ class InterviewPanelView(APIView):
                 {'interview_panels': serializer.data}
             )
     
-    def put(self, request, interview_panel_uuid=None, **kwargs):
-        interview_panel_uuid = interview_panel_uuid or kwargs.get('interview_panel_uuid')
-        
-        if not interview_panel_uuid:
-            return ApiResponseBuilder.error(
-                'Interview panel UUID is required',
-                status_code=status.HTTP_400_BAD_REQUEST
-            )
-        
-        if not request.user.role:
-            return ApiResponseBuilder.error(
-                'User must have a role',
-                status_code=status.HTTP_403_FORBIDDEN
-            )
-        
-        role_name = request.user.role.name.lower()
-        if role_name not in ['admin', 'hr']:
-            return ApiResponseBuilder.error(
-                'Only admin and HR users can update interview panels',
-                status_code=status.HTTP_403_FORBIDDEN
-            )
-        
-        try:
-            interview_panel = InterviewPanel.objects.get(
-                uuid=interview_panel_uuid,
-                organization=request.user.organization,
-                is_deleted=False
-            )
-        except InterviewPanel.DoesNotExist:
-            return ApiResponseBuilder.error(
-                'Interview panel not found',
-                status_code=status.HTTP_404_NOT_FOUND
-            )
-        
-        interview_panel.check_and_deactivate()
-        interview_panel.refresh_from_db()
-        
-        if not interview_panel.is_active:
+    @with_interview_panel()
+    def put(self, request, interview_panel):
+        if not interview_panel.check_and_deactivate():
             return ApiResponseBuilder.error(
                 'Cannot update inactive interview panel',
                 status_code=status.HTTP_400_BAD_REQUEST
@@ -275,49 +277,16 @@ class InterviewPanelView(APIView):
             )
         
         serializer.save(updated_by=request.user)
-        interview_panel.refresh_from_db()
-        interview_panel.check_and_deactivate()
         
         return ApiResponseBuilder.success(
             'Interview panel updated successfully',
             InterviewPanelSerializer(interview_panel).data
         )
     
-    def delete(self, request, interview_panel_uuid=None, **kwargs):
-        interview_panel_uuid = interview_panel_uuid or kwargs.get('interview_panel_uuid')
-        
-        if not interview_panel_uuid:
-            return ApiResponseBuilder.error(
-                'Interview panel UUID is required',
-                status_code=status.HTTP_400_BAD_REQUEST
-            )
-        if not request.user.role:
-            return ApiResponseBuilder.error(
-                'User must have a role',
-                status_code=status.HTTP_403_FORBIDDEN
-            )
-        
-        role_name = request.user.role.name.lower()
-        if role_name not in ['admin', 'hr']:
-            return ApiResponseBuilder.error(
-                'Only admin and HR users can delete interview panels',
-                status_code=status.HTTP_403_FORBIDDEN
-            )
-        
-        try:
-            interview_panel = InterviewPanel.objects.get(
-                uuid=interview_panel_uuid,
-                organization=request.user.organization,
-                is_deleted=False
-            )
-        except InterviewPanel.DoesNotExist:
-            return ApiResponseBuilder.error(
-                'Interview panel not found',
-                status_code=status.HTTP_404_NOT_FOUND
-            )
-        
+    @with_interview_panel(only=('id', 'uuid', 'is_active', 'is_deleted', 'organization', 'end_datetime'))
+    def delete(self, request, interview_panel):
         interview_panel.is_deleted = True
-        interview_panel.save()
+        interview_panel.save(update_fields=['is_deleted', 'updated_at'])
         
         return ApiResponseBuilder.success(
             'Interview panel deleted successfully'
@@ -328,15 +297,22 @@ class StartInterviewPanelView(APIView):
     permission_classes = [permissions.AllowAny]
 
     def post(self, request, token):
+        username = request.data.get('username')
+        password = request.data.get('password')
+        
+        if not username or not password:
+            return ApiResponseBuilder.error(
+                'Username and password are required',
+                status_code=status.HTTP_400_BAD_REQUEST)
+        
         try:
-            interview_panel_candidate = InterviewPanelCandidate.objects.get(token=token)
-            username = request.data.get('username')
-            password = request.data.get('password')
-            
-            if not username or not password:
-                return ApiResponseBuilder.error(
-                    'Username and password are required',
-                    status_code=status.HTTP_400_BAD_REQUEST)
+            interview_panel_candidate = InterviewPanelCandidate.objects.select_related(
+                'candidate', 'interview_panel'
+            ).only(
+                'token',
+                'candidate__email', 'candidate__password', 'candidate__salt', 'candidate__organization_id',
+                'interview_panel__start_datetime', 'interview_panel__end_datetime', 'interview_panel__organization_id'
+            ).get(token_hash=InterviewPanelCandidate.hash_token(token))
             
             candidate = interview_panel_candidate.candidate
             
@@ -345,24 +321,28 @@ class StartInterviewPanelView(APIView):
                     'Invalid username or password',
                     status_code=status.HTTP_401_UNAUTHORIZED)
             
-            if candidate.organization != interview_panel_candidate.interview_panel.organization:
+            if candidate.organization_id != interview_panel_candidate.interview_panel.organization_id:
                 return ApiResponseBuilder.error(
                     'Candidate not found',
                     status_code=status.HTTP_404_NOT_FOUND)
             
-            if not candidate.check_password(password):
-                return ApiResponseBuilder.error(
-                    'Invalid username or password',
-                    status_code=status.HTTP_401_UNAUTHORIZED)
-            if interview_panel_candidate.interview_panel.start_datetime > timezone.now():
+            # Password checks derive a PBKDF2 key, so reject closed panels first
+            now = timezone.now()
+            panel = interview_panel_candidate.interview_panel
+            if panel.start_datetime > now:
                 return ApiResponseBuilder.error(
                     'Interview panel has not started yet',
                     status_code=status.HTTP_400_BAD_REQUEST)
-            if interview_panel_candidate.interview_panel.end_datetime < timezone.now():
+            if panel.end_datetime < now:
                 return ApiResponseBuilder.error(
                     'Interview panel has ended',
                     status_code=status.HTTP_400_BAD_REQUEST)
             
+            if not candidate.check_password(password):
+                return ApiResponseBuilder.error(
+                    'Invalid username or password',
+                    status_code=status.HTTP_401_UNAUTHORIZED)
+            
             return ApiResponseBuilder.success(
                 'Interview panel started successfully',
                 status_code=status.HTTP_200_OK)
@@ -370,11 +350,6 @@ class StartInterviewPanelView(APIView):
             return ApiResponseBuilder.error(
                 'Invalid token',
                 status_code=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            return ApiResponseBuilder.error(
-                'Error starting interview panel',
-                str(e),
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @method_decorator(csrf_exempt, name='dispatch')
 class CandidateReportDetailView(APIView):
@@ -390,7 +365,10 @@ class CandidateReportDetailView(APIView):
             )
         
         try:
-            session = InterviewSession.objects.get(
+            session = InterviewSession.objects.select_related(
+                'interview_panel_candidate__candidate',
+                'interview_panel_candidate__interview_panel__organization'
+            ).get(
                 uuid=session_uuid,
                 is_deleted=False
             )
@@ -422,41 +400,49 @@ class CandidateReportDetailView(APIView):
                 interview_session=session,
                 question__isnull=False,
                 is_deleted=False
-            ).select_related('question__question').order_by('round_number')
+            ).select_related('question__question').prefetch_related(
+                Prefetch(
+                    'interview_session_answerwise_feedbacks',
+                    queryset=InterviewReportAnswerwiseFeedback.objects.filter(
+                        interview_session=session,
+                        is_deleted=False
+                    ),
+                    to_attr='active_feedbacks'
+                )
+            ).order_by('round_number')
             
             # Calculate competency scores
-            technical_scores = []
-            behavioral_scores = []
-            psychological_scores = []
+            competency_averages = answers.aggregate(
+                technical=Avg(
+                    Coalesce(F('score_technical'), 0.0) +
+                    Coalesce(F('score_domain_knowledge'), 0.0) +
+                    Coalesce(F('score_problem_solving'), 0.0)
+                ),
+                behavioral=Avg(
+                    Coalesce(F('score_communication'), 0.0) +
+                    Coalesce(F('score_creativity'), 0.0) +
+                    Coalesce(F('score_attention_to_detail'), 0.0) +
+                    Coalesce(F('score_time_management'), 0.0) +
+                    Coalesce(F('score_stress_management'), 0.0) +
+                    Coalesce(F('score_adaptability'), 0.0) +
+                    Coalesce(F('score_confidence'), 0.0)
+                ),
+                psychological=Avg(
+                    Coalesce(F('score_confidence'), 0.0) +
+                    Coalesce(F('score_stress_management'), 0.0)
+                )
+            )
+            avg_technical = competency_averages['technical'] or 0.0
+            avg_behavioral = competency_averages['behavioral'] or 0.0
+            avg_psychological = competency_averages['psychological'] or 0.0
             
             answer_data_list = []
-            for answer in answers:
-                # Technical competency
-                tech_score = (answer.score_technical or 0) + (answer.score_domain_knowledge or 0) + (answer.score_problem_solving or 0)
-                technical_scores.append(tech_score)
-                
-                # Behavioral and soft skills competency
-                behavioral_score = (
-                    (answer.score_communication or 0) + 
-                    (answer.score_creativity or 0) + 
-                    (answer.score_attention_to_detail or 0) + 
-                    (answer.score_time_management or 0) + 
-                    (answer.score_stress_management or 0) + 
-                    (answer.score_adaptability or 0) + 
-                    (answer.score_confidence or 0)
-                )
-                behavioral_scores.append(behavioral_score)
-                
-                # Psychological traits competency
-                psychological_score = (answer.score_confidence or 0) + (answer.score_stress_management or 0)
-                psychological_scores.append(psychological_score)
-                
+            for answer in answers.only(
+                'round_number', 'score', 'full_transcription', 'transcription',
+                'question__question__question'
+            ):
                 # Get feedback
-                feedback_obj = InterviewReportAnswerwiseFeedback.objects.filter(
-                    interview_session=session,
-                    answer=answer,
-                    is_deleted=False
-                ).first()
+                feedback_obj = answer.active_feedbacks[0] if answer.active_feedbacks else None
                 
                 answer_data_list.append({
                     'question': answer.question.question.question,
@@ -466,10 +452,6 @@ class CandidateReportDetailView(APIView):
                     'round_number': answer.round_number
                 })
             
-            avg_technical = sum(technical_scores) / len(technical_scores) if technical_scores else 0.0
-            avg_behavioral = sum(behavioral_scores) / len(behavioral_scores) if behavioral_scores else 0.0
-            avg_psychological = sum(psychological_scores) / len(psychological_scores) if psychological_scores else 0.0
-            
             report_data = {
                 'session_uuid': str(session.uuid),
                 'candidate_name': f"{candidate.first_name} {candidate.last_name}",
@@ -494,11 +476,6 @@ class CandidateReportDetailView(APIView):
                 'Interview session not found',
                 status_code=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return ApiResponseBuilder.error(
-                'Error retrieving report data',
-                str(e),
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @method_decorator(csrf_exempt, name='dispatch')
 class CandidateReportDownloadView(APIView):
@@ -512,7 +489,10 @@ class CandidateReportDownloadView(APIView):
             )
         
         try:
-            session = InterviewSession.objects.get(
+            session = InterviewSession.objects.select_related(
+                'interview_panel_candidate__candidate',
+                'interview_panel_candidate__interview_panel__organization'
+            ).get(
                 uuid=session_uuid,
                 is_deleted=False
             )
@@ -543,9 +523,25 @@ class CandidateReportDownloadView(APIView):
                 )
             
             # Build full path to PDF
-            pdf_path = Path(settings.BASE_DIR) / session.report_pdf_path
+            full_path = os.path.join(settings.BASE_DIR, session.report_pdf_path)
+            filename = os.path.basename(full_path)
             
-            if not pdf_path.exists():
+            # Let the reverse proxy stream the file when internal redirects are configured
+            accel_prefix = getattr(settings, 'REPORTS_ACCEL_REDIRECT_PREFIX', '')
+            if accel_prefix:
+                if not os.path.isfile(full_path):
+                    return ApiResponseBuilder.error(
+                        'Report PDF file not found',
+                        status_code=status.HTTP_404_NOT_FOUND
+                    )
+                response = HttpResponse(content_type='application/pdf')
+                response['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{session.report_pdf_path.lstrip('/')}"
+                response['Content-Disposition'] = f'attachment; filename="{filename}"'
+                return response
+            
+            try:
+                pdf_file = open(full_path, 'rb')
+            except FileNotFoundError:
                 return ApiResponseBuilder.error(
                     'Report PDF file not found',
                     status_code=status.HTTP_404_NOT_FOUND
@@ -553,17 +549,12 @@ class CandidateReportDownloadView(APIView):
             
             # Return file response
             return FileResponse(
-                open(pdf_path, 'rb'),
+                pdf_file,
                 content_type='application/pdf',
-                filename=pdf_path.name
+                filename=filename
             )
         except InterviewSession.DoesNotExist:
             return ApiResponseBuilder.error(
                 'Interview session not found',
                 status_code=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return ApiResponseBuilder.error(
-                'Error downloading report',
-                str(e),
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-15 13:41
+
+from django.db import migrations, models
+import utils.uuid7
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '20251129071919_0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organization',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+    ]
@@ -1,11 +1,12 @@
-import uuid
 from django.db import models
 from authentication.models import User
+from utils.model_str import loaded_str
+from utils.uuid7 import uuid7
 
 
 class Organization(models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=255)
     address = models.TextField()
     email = models.EmailField()
@@ -26,4 +27,4 @@ class Organization(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return self.name
+        return loaded_str(self)
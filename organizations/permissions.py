@@ -13,7 +13,7 @@ class IsAdmin(permissions.BasePermission):
             return False
         
         # Check if user has admin role
-        return request.user.role and request.user.role.name.lower() == 'admin'
+        return request.user.role_name == 'admin'
 
 
 class IsHr(permissions.BasePermission):
@@ -28,7 +28,7 @@ class IsHr(permissions.BasePermission):
             return False
         
         # Check if user has HR role
-        return request.user.role and request.user.role.name.lower() == 'hr'
+        return request.user.role_name == 'hr'
 
 
 class IsAdminOrHr(permissions.BasePermission):
@@ -43,8 +43,5 @@ class IsAdminOrHr(permissions.BasePermission):
             return False
         
         # Check if user has admin or HR role
-        if request.user.role:
-            role_name = request.user.role.name.lower()
-            return role_name in ['admin', 'hr']
-        return False
+        return request.user.role_name in ('admin', 'hr')
 
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from .models import Organization
-from authentication.models import User, Role
+from authentication.models import User, Role, get_role
 from utils.crypto_utils import PasswordCrypto
 
 
@@ -42,11 +42,6 @@ class AddHrSerializer(serializers.Serializer):
             raise serializers.ValidationError("Organization is required.")
         return value
 
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("User with this email already exists.")
-        return value
-
     def create(self, validated_data):
         admin_user = self.context['request'].user
         organization = admin_user.organization
@@ -54,7 +49,7 @@ class AddHrSerializer(serializers.Serializer):
         if not organization:
             raise serializers.ValidationError("Admin user must belong to an organization.")
         try:
-            hr_role = Role.objects.get(name__iexact='hr')
+            hr_role = get_role('hr')
         except Role.DoesNotExist:
             raise serializers.ValidationError("HR role does not exist. Please run create_roles command.")
 
@@ -2,6 +2,7 @@ from rest_framework import status, permissions
 from rest_framework.views import APIView
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.db import IntegrityError
 from utils.api_response import ApiResponseBuilder
 from .models import Organization
 from .serializers import (
@@ -30,9 +31,9 @@ class CreateOrganizationView(APIView):
         serializer = self.serializer_class(data=request.data, context={'request': request})
         if serializer.is_valid():
             organization = serializer.save()
-            from authentication.models import Role
+            from authentication.models import Role, get_role
             try:
-                admin_role = Role.objects.get(name__iexact='admin')
+                admin_role = get_role('admin')
                 request.user.role = admin_role
                 request.user.save()
             except Role.DoesNotExist:
@@ -56,14 +57,21 @@ class AddHrView(APIView):
                 'User must belong to an organization',
                 status_code=status.HTTP_400_BAD_REQUEST
             )
-        if not request.user.role or request.user.role.name.lower() != 'admin':
+        if request.user.role_name != 'admin':
             return ApiResponseBuilder.error(
                 'Only organization admin can add HR users',
                 status_code=status.HTTP_403_FORBIDDEN
             )
         serializer = self.serializer_class(data=request.data, context={'request': request})
         if serializer.is_valid():
-            hr_user = serializer.save()
+            # The unique index on email is the duplicate check
+            try:
+                hr_user = serializer.save()
+            except IntegrityError:
+                return ApiResponseBuilder.error(
+                    'Failed to add HR user',
+                    {'email': ['User with this email already exists.']}
+                )
             return ApiResponseBuilder.success(
                 'HR user added successfully',
                 UserSerializer(hr_user).data,
@@ -0,0 +1,73 @@
+import math
+
+from django import forms
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+from django.db.models import lookups
+
+
+class HundredthsField(models.SmallIntegerField):
+    """
+    A 0..1 float with two decimal places, stored as a smallint number of hundredths.
+
+    Python code keeps reading and writing floats; only the column is compact
+    (2 bytes instead of an 8-byte, 8-byte-aligned double precision).
+    """
+    default_validators = [MinValueValidator(0), MaxValueValidator(1)]
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return value / 100
+
+    def to_python(self, value):
+        if value is None or isinstance(value, float):
+            return value
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return super().to_python(value)
+
+    def get_prep_value(self, value):
+        if value is None or hasattr(value, 'resolve_expression'):
+            return value
+        return round(float(value) * 100)
+
+    def formfield(self, **kwargs):
+        return super().formfield(**{'form_class': forms.FloatField, **kwargs})
+
+
+class HundredthsBoundMixin:
+    """
+    Scale a float bound to hundredths before rounding it to the stored integer.
+
+    IntegerField's own lookups round the float first, so __gte=0.25 would compare
+    against ceil(0.25) * 100 = 100 hundredths.
+    """
+    rounding = math.ceil
+
+    def get_prep_lookup(self):
+        if isinstance(self.rhs, float):
+            # round() first so 0.29 * 100 = 28.999999999999996 still counts as 29
+            return self.rounding(round(self.rhs * 100, 6))
+        return super().get_prep_lookup()
+
+
+@HundredthsField.register_lookup
+class HundredthsGreaterThan(HundredthsBoundMixin, lookups.IntegerGreaterThan):
+    rounding = math.floor
+
+
+@HundredthsField.register_lookup
+class HundredthsGreaterThanOrEqual(HundredthsBoundMixin, lookups.IntegerGreaterThanOrEqual):
+    rounding = math.ceil
+
+
+@HundredthsField.register_lookup
+class HundredthsLessThan(HundredthsBoundMixin, lookups.IntegerLessThan):
+    rounding = math.ceil
+
+
+@HundredthsField.register_lookup
+class HundredthsLessThanOrEqual(HundredthsBoundMixin, lookups.IntegerLessThanOrEqual):
+    rounding = math.floor
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-15 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20251130080436_20251129093247_remove_question_embedding_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['-created_at'], name='category_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topic',
+            index=models.Index(fields=['category', '-created_at'], name='topic_category_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subtopic',
+            index=models.Index(fields=['topic', '-created_at'], name='subtopic_topic_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['category', 'topic', 'subtopic', 'difficulty_level'], name='question_pool_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['-created_at'], name='question_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionconfiguration',
+            index=models.Index(fields=['organization', '-created_at'], name='qconfig_org_created_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-15 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015111210_20251129093248_category_category_created_at_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='question',
+            name='difficulty_level',
+            field=models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], default='easy', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='questionconfiguration',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=16),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-15 12:05
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015113402_20251129093249_alter_question_difficulty_level_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['expected_keywords'], name='question_keywords_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-15 13:41
+
+from django.db import migrations, models
+import utils.uuid7
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015120521_20251129093250_question_question_keywords_gin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='topic',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='subtopic',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='question',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='questionconfiguration',
+            name='uuid',
+            field=models.UUIDField(default=utils.uuid7.uuid7, editable=False, unique=True),
+        ),
+    ]
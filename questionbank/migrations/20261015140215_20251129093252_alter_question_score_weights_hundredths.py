@@ -0,0 +1,106 @@
+# Generated by Django 5.2.8 on 2026-10-15 14:02
+
+from django.db import migrations
+import questionbank.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015134108_20251129093251_alter_category_uuid_and_more'),
+    ]
+
+    operations = [
+        # A plain AlterField would cast 0.35 straight to 0; scale to hundredths in the USING clause
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql="""
+                    ALTER TABLE "questions"
+                        ALTER COLUMN "expected_keywords_coverage" TYPE smallint USING round("expected_keywords_coverage" * 100)::smallint,
+                        ALTER COLUMN "score_weight_technical" TYPE smallint USING round("score_weight_technical" * 100)::smallint,
+                        ALTER COLUMN "score_weight_domain_knowledge" TYPE smallint USING round("score_weight_domain_knowledge" * 100)::smallint,
+                        ALTER COLUMN "score_weight_communication" TYPE smallint USING round("score_weight_communication" * 100)::smallint,
+                        ALTER COLUMN "score_weight_problem_solving" TYPE smallint USING round("score_weight_problem_solving" * 100)::smallint,
+                        ALTER COLUMN "score_weight_creativity" TYPE smallint USING round("score_weight_creativity" * 100)::smallint,
+                        ALTER COLUMN "score_weight_attention_to_detail" TYPE smallint USING round("score_weight_attention_to_detail" * 100)::smallint,
+                        ALTER COLUMN "score_weight_time_management" TYPE smallint USING round("score_weight_time_management" * 100)::smallint,
+                        ALTER COLUMN "score_weight_stress_management" TYPE smallint USING round("score_weight_stress_management" * 100)::smallint,
+                        ALTER COLUMN "score_weight_adaptability" TYPE smallint USING round("score_weight_adaptability" * 100)::smallint,
+                        ALTER COLUMN "score_weight_confidence" TYPE smallint USING round("score_weight_confidence" * 100)::smallint;
+                    """,
+                    reverse_sql="""
+                    ALTER TABLE "questions"
+                        ALTER COLUMN "expected_keywords_coverage" TYPE double precision USING "expected_keywords_coverage" / 100.0,
+                        ALTER COLUMN "score_weight_technical" TYPE double precision USING "score_weight_technical" / 100.0,
+                        ALTER COLUMN "score_weight_domain_knowledge" TYPE double precision USING "score_weight_domain_knowledge" / 100.0,
+                        ALTER COLUMN "score_weight_communication" TYPE double precision USING "score_weight_communication" / 100.0,
+                        ALTER COLUMN "score_weight_problem_solving" TYPE double precision USING "score_weight_problem_solving" / 100.0,
+                        ALTER COLUMN "score_weight_creativity" TYPE double precision USING "score_weight_creativity" / 100.0,
+                        ALTER COLUMN "score_weight_attention_to_detail" TYPE double precision USING "score_weight_attention_to_detail" / 100.0,
+                        ALTER COLUMN "score_weight_time_management" TYPE double precision USING "score_weight_time_management" / 100.0,
+                        ALTER COLUMN "score_weight_stress_management" TYPE double precision USING "score_weight_stress_management" / 100.0,
+                        ALTER COLUMN "score_weight_adaptability" TYPE double precision USING "score_weight_adaptability" / 100.0,
+                        ALTER COLUMN "score_weight_confidence" TYPE double precision USING "score_weight_confidence" / 100.0;
+                    """,
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='question',
+                    name='expected_keywords_coverage',
+                    field=questionbank.fields.HundredthsField(default=0.1),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_technical',
+                    field=questionbank.fields.HundredthsField(default=0.5),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_domain_knowledge',
+                    field=questionbank.fields.HundredthsField(default=0.3),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_communication',
+                    field=questionbank.fields.HundredthsField(default=0.1),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_problem_solving',
+                    field=questionbank.fields.HundredthsField(default=0.05),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_creativity',
+                    field=questionbank.fields.HundredthsField(default=0.05),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_attention_to_detail',
+                    field=questionbank.fields.HundredthsField(default=0.05),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_time_management',
+                    field=questionbank.fields.HundredthsField(default=0.05),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_stress_management',
+                    field=questionbank.fields.HundredthsField(default=0.05),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_adaptability',
+                    field=questionbank.fields.HundredthsField(default=0.05),
+                ),
+                migrations.AlterField(
+                    model_name='question',
+                    name='score_weight_confidence',
+                    field=questionbank.fields.HundredthsField(default=0.05),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.8 on 2026-10-15 14:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015140215_20251129093252_alter_question_score_weights_hundredths'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='created_by',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='created_categories', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='updated_by',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='updated_categories', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='topic',
+            name='created_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='created_topics', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='topic',
+            name='updated_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='updated_topics', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='subtopic',
+            name='created_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='created_subtopics', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='subtopic',
+            name='updated_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='updated_subtopics', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='question',
+            name='created_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='created_questions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='question',
+            name='updated_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='updated_questions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='questionconfiguration',
+            name='created_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='created_question_configurations', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='questionconfiguration',
+            name='updated_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='updated_question_configurations', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
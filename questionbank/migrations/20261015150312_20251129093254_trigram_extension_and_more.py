@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-15 15:03
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015142033_20251129093253_alter_category_created_by_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='subtopic',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='subtopic_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['question'], name='question_text_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.8 on 2026-10-15 15:31
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015150312_20251129093254_trigram_extension_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='question',
+            name='question_text_trgm',
+        ),
+        migrations.RemoveIndex(
+            model_name='subtopic',
+            name='subtopic_name_trgm',
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='question_normalized',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower(django.db.models.functions.text.Trim('question')), output_field=models.TextField()),
+        ),
+        migrations.AddField(
+            model_name='subtopic',
+            name='name_normalized',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower(django.db.models.functions.text.Trim('name')), output_field=models.CharField(max_length=255)),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['question_normalized'], name='question_norm_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='subtopic',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name_normalized'], name='subtopic_name_norm_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
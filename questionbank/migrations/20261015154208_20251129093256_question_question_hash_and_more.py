@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-15 15:42
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Concat
+
+
+def rename_duplicate_questions(apps, schema_editor):
+    """
+    Make existing duplicates distinct so unique_question_text_per_pool can be added.
+
+    The oldest question of each (category, topic, subtopic, question_hash) group keeps its
+    text; the others get a ' (duplicate #<id>)' suffix. Rows are renamed, not merged, so
+    interview panels and answers that reference them are untouched.
+    """
+    Question = apps.get_model('questionbank', 'Question')
+    seen = set()
+    duplicate_ids = []
+    rows = Question.objects.order_by('id').values_list(
+        'id', 'category_id', 'topic_id', 'subtopic_id', 'question_hash'
+    )
+    for question_id, *pool_key in rows.iterator(chunk_size=2000):
+        pool_key = tuple(pool_key)
+        if pool_key in seen:
+            duplicate_ids.append(question_id)
+        else:
+            seen.add(pool_key)
+    if duplicate_ids:
+        Question.objects.filter(id__in=duplicate_ids).update(
+            question=Concat('question', Value(' (duplicate #'), Cast('id', CharField()), Value(')'))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015153126_20251129093255_question_normalized_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='question_hash',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.MD5(django.db.models.functions.text.Lower(django.db.models.functions.text.Trim('question'))), output_field=models.CharField(max_length=32)),
+        ),
+        migrations.RunPython(rename_duplicate_questions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='question',
+            constraint=models.UniqueConstraint(fields=('category', 'topic', 'subtopic', 'question_hash'), name='unique_question_text_per_pool', nulls_distinct=False),
+        ),
+    ]
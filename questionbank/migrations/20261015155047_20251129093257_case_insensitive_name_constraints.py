@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-15 15:50
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+# (model, field the name must be unique within, or None for globally unique names)
+NAME_SCOPES = (('Category', None), ('Topic', 'category_id'), ('Subtopic', 'topic_id'))
+
+
+def rename_case_duplicate_names(apps, schema_editor):
+    """
+    Rename names that differ only by case so the Lower('name') constraints can be added.
+
+    The oldest row keeps its name; later ones get a ' (duplicate #<id>)' suffix, so the
+    questions and configurations that point at them are untouched.
+    """
+    for model_name, scope in NAME_SCOPES:
+        model = apps.get_model('questionbank', model_name)
+        seen = set()
+        rows = model.objects.annotate(name_lower=Lower('name')).order_by('id')
+        for row in rows.only('id', 'name', *([scope] if scope else [])):
+            key = (getattr(row, scope) if scope else None, row.name_lower)
+            if key not in seen:
+                seen.add(key)
+                continue
+            suffix = f' (duplicate #{row.id})'
+            row.name = row.name[:255 - len(suffix)] + suffix
+            row.save(update_fields=['name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015154208_20251129093256_question_question_hash_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='category',
+            name='unique_category_name',
+        ),
+        migrations.RemoveConstraint(
+            model_name='subtopic',
+            name='unique_subtopic_name_per_topic',
+        ),
+        migrations.RemoveConstraint(
+            model_name='topic',
+            name='unique_topic_name_per_category',
+        ),
+        migrations.RunPython(rename_case_duplicate_names, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='unique_category_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='subtopic',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), models.F('topic'), name='unique_subtopic_name_per_topic'),
+        ),
+        migrations.AddConstraint(
+            model_name='topic',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), models.F('category'), name='unique_topic_name_per_category'),
+        ),
+    ]
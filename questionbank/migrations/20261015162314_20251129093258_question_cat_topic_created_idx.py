@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 16:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionbank', '20261015155047_20251129093257_case_insensitive_name_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['category', 'topic', '-created_at'], name='question_cat_topic_created_idx'),
+        ),
+    ]
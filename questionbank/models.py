@@ -1,19 +1,42 @@
-from django.db import models
-import uuid
+import time
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.db.models.functions import MD5, Lower, Trim
+from django.contrib.postgres.indexes import GinIndex
 from organizations.models import Organization
 from authentication.models import User
+from .fields import HundredthsField
+from .weightage_calculator import WeightageCalculator
+from utils.model_str import loaded_str
+from utils.uuid7 import uuid7
 
 # Create your models here.
 
-class Category(models.Model):
+class CreatedByMixin:
+    """Stamps created_by/updated_by from an explicit user instead of the request"""
+
+    @classmethod
+    def create_for_user(cls, user, **fields):
+        return cls.objects.create(created_by=user, updated_by=user, **fields)
+
+
+class QuestionQuerySet(models.QuerySet):
+    def with_taxonomy(self):
+        return self.select_related('category', 'topic', 'subtopic')
+
+
+class Category(CreatedByMixin, models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_categories')
-    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_categories')
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_categories', db_index=False)
+    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_categories', db_index=False)
 
     class Meta:
         verbose_name = 'Category'
@@ -21,29 +44,25 @@ class Category(models.Model):
         db_table = 'categories'
         ordering = ['-created_at']
         constraints = [
-            models.UniqueConstraint(fields=['name'], name='unique_category_name')
+            models.UniqueConstraint(Lower('name'), name='unique_category_name')
+        ]
+        indexes = [
+            models.Index(fields=['-created_at'], name='category_created_at_idx')
         ]
 
     def __str__(self):
-        return self.name
-    
-    def save(self, request=None, *args, **kwargs):
-        if request and not self.created_by:
-            self.created_by = request.user
-        if request and not self.updated_by:
-            self.updated_by = request.user
-        super().save(*args, **kwargs)
+        return loaded_str(self)
         
-class Topic(models.Model):
+class Topic(CreatedByMixin, models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='topics')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_topics', null=True, blank=True)
-    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_topics', null=True, blank=True)
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_topics', null=True, blank=True, db_index=False)
+    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_topics', null=True, blank=True, db_index=False)
 
     class Meta:
         verbose_name = 'Topic'
@@ -51,29 +70,29 @@ class Topic(models.Model):
         db_table = 'topics'
         ordering = ['-created_at']
         constraints = [
-            models.UniqueConstraint(fields=['name', 'category'], name='unique_topic_name_per_category')
+            models.UniqueConstraint(Lower('name'), 'category', name='unique_topic_name_per_category')
+        ]
+        indexes = [
+            models.Index(fields=['category', '-created_at'], name='topic_category_created_idx')
         ]
 
     def __str__(self):
-        return self.name
-    
-    def save(self, request=None, *args, **kwargs):
-        if request and not self.created_by:
-            self.created_by = request.user
-        if request and not self.updated_by:
-            self.updated_by = request.user
-        super().save(*args, **kwargs)
+        return loaded_str(self)
         
-class Subtopic(models.Model):
+class Subtopic(CreatedByMixin, models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=255)
+    # lower(trim(name)), maintained by Postgres for the similarity checks
+    name_normalized = models.GeneratedField(
+        expression=Lower(Trim('name')), output_field=models.CharField(max_length=255), db_persist=True
+    )
     description = models.TextField(blank=True, null=True)
     topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='subtopics')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_subtopics', null=True, blank=True)
-    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_subtopics', null=True, blank=True)
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_subtopics', null=True, blank=True, db_index=False)
+    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_subtopics', null=True, blank=True, db_index=False)
 
     class Meta:
         verbose_name = 'Subtopic'
@@ -81,18 +100,33 @@ class Subtopic(models.Model):
         db_table = 'subtopics'
         ordering = ['-created_at']
         constraints = [
-            models.UniqueConstraint(fields=['name', 'topic'], name='unique_subtopic_name_per_topic')
+            models.UniqueConstraint(Lower('name'), 'topic', name='unique_subtopic_name_per_topic')
+        ]
+        indexes = [
+            models.Index(fields=['topic', '-created_at'], name='subtopic_topic_created_idx'),
+            GinIndex(fields=['name_normalized'], name='subtopic_name_norm_trgm', opclasses=['gin_trgm_ops'])
         ]
 
     def __str__(self):
-        return self.name
-    
-    def save(self, request=None, *args, **kwargs):
-        if request and not self.created_by:
-            self.created_by = request.user
-        if request and not self.updated_by:
-            self.updated_by = request.user
-        super().save(*args, **kwargs)
+        return loaded_str(self)
+
+
+# Part of every cached category/topic/subtopic list key; replacing it orphans them all
+TAXONOMY_CACHE_VERSION_KEY = 'qb:taxonomy_version'
+
+
+def taxonomy_cache_version():
+    return cache.get_or_set(TAXONOMY_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Topic)
+@receiver([post_save, post_delete], sender=Subtopic)
+def clear_taxonomy_cache(sender, **kwargs):
+    # A fresh timestamp rather than incr(), so an evicted version key can never come back
+    # as a value that older cached lists were stored under. Replaced on commit, so a list
+    # built from the old rows before then is never cached under the new version
+    transaction.on_commit(lambda: cache.set(TAXONOMY_CACHE_VERSION_KEY, time.time_ns(), None))
 
 
 class DifficultyLevel(models.TextChoices):
@@ -100,9 +134,9 @@ class DifficultyLevel(models.TextChoices):
     MEDIUM = 'medium'
     HARD = 'hard'
 
-class Question(models.Model):
+class Question(CreatedByMixin, models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='questions')
@@ -111,39 +145,74 @@ class Question(models.Model):
 
     # adaptive analysis parameters
     question = models.TextField()
-    difficulty_level = models.CharField(max_length=255, choices=DifficultyLevel.choices, default=DifficultyLevel.EASY)
+    # lower(trim(question)), maintained by Postgres for the duplicate checks
+    question_normalized = models.GeneratedField(
+        expression=Lower(Trim('question')), output_field=models.TextField(), db_persist=True
+    )
+    # md5 of the normalized text; the unique key for exact duplicates within a pool
+    question_hash = models.GeneratedField(
+        expression=MD5(Lower(Trim('question'))), output_field=models.CharField(max_length=32), db_persist=True
+    )
+    difficulty_level = models.CharField(max_length=16, choices=DifficultyLevel.choices, default=DifficultyLevel.EASY)
     expected_answer = models.TextField()
     expected_time_in_seconds = models.IntegerField(default=60)
     ideal_answer_summary = models.TextField(blank=True, null=True)
     red_flags = models.JSONField(default=list)
 
     expected_keywords = models.JSONField(default=list)
-    expected_keywords_coverage = models.FloatField(default=0.1)
-
-    score_weight_technical = models.FloatField(default=0.5)
-    score_weight_domain_knowledge = models.FloatField(default=0.3)
-    score_weight_communication = models.FloatField(default=0.1)
-    score_weight_problem_solving = models.FloatField(default=0.05)
-    score_weight_creativity = models.FloatField(default=0.05)
-    score_weight_attention_to_detail = models.FloatField(default=0.05)
-    score_weight_time_management = models.FloatField(default=0.05)
-    score_weight_stress_management = models.FloatField(default=0.05)
-    score_weight_adaptability = models.FloatField(default=0.05)
-    score_weight_confidence = models.FloatField(default=0.05)
+    expected_keywords_coverage = HundredthsField(default=0.1)
+
+    score_weight_technical = HundredthsField(default=0.5)
+    score_weight_domain_knowledge = HundredthsField(default=0.3)
+    score_weight_communication = HundredthsField(default=0.1)
+    score_weight_problem_solving = HundredthsField(default=0.05)
+    score_weight_creativity = HundredthsField(default=0.05)
+    score_weight_attention_to_detail = HundredthsField(default=0.05)
+    score_weight_time_management = HundredthsField(default=0.05)
+    score_weight_stress_management = HundredthsField(default=0.05)
+    score_weight_adaptability = HundredthsField(default=0.05)
+    score_weight_confidence = HundredthsField(default=0.05)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_questions', null=True, blank=True)
-    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_questions', null=True, blank=True)
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_questions', null=True, blank=True, db_index=False)
+    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_questions', null=True, blank=True, db_index=False)
+
+    objects = QuestionQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'Question'
         verbose_name_plural = 'Questions'
         db_table = 'questions'
         ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['category', 'topic', 'subtopic', 'question_hash'],
+                name='unique_question_text_per_pool',
+                nulls_distinct=False
+            )
+        ]
+        indexes = [
+            # Panel creation samples by category, topic, subtopic and difficulty
+            models.Index(fields=['category', 'topic', 'subtopic', 'difficulty_level'], name='question_pool_idx'),
+            models.Index(fields=['-created_at'], name='question_created_at_idx'),
+            # The question list filtered by category/topic, newest first, without a sort step
+            models.Index(fields=['category', 'topic', '-created_at'], name='question_cat_topic_created_idx'),
+            GinIndex(fields=['expected_keywords'], name='question_keywords_gin', opclasses=['jsonb_path_ops']),
+            # Near-duplicate lookups during generation (pg_trgm % operator)
+            GinIndex(fields=['question_normalized'], name='question_norm_trgm', opclasses=['gin_trgm_ops'])
+        ]
 
     def __str__(self):
-        return self.name
+        return loaded_str(self)
+
+    @property
+    def score_weights(self):
+        """Score weights keyed by skill, with the defaults filled in for unset columns"""
+        return {
+            skill: getattr(self, f'score_weight_{skill}') or default
+            for skill, default in WeightageCalculator.BASE_WEIGHTS.items()
+        }
     
     def save(self, *args, **kwargs):
         # Questions are shared across organizations, no organization field needed
@@ -157,15 +226,15 @@ class QuestionConfigurationStatus(models.TextChoices):
     FAILED = 'failed'
    
 
-class QuestionConfiguration(models.Model):
+class QuestionConfiguration(CreatedByMixin, models.Model):
     id = models.AutoField(primary_key=True)
-    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    uuid = models.UUIDField(default=uuid7, unique=True, editable=False)
     name = models.CharField(max_length=255)
     organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name='question_configurations')
     category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='question_configurations')
     topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='question_configurations')
     subtopic = models.ForeignKey(Subtopic, on_delete=models.CASCADE, related_name='question_configurations', null=True, blank=True)
-    status = models.CharField(max_length=255, choices=QuestionConfigurationStatus.choices, default=QuestionConfigurationStatus.PENDING)
+    status = models.CharField(max_length=16, choices=QuestionConfigurationStatus.choices, default=QuestionConfigurationStatus.PENDING)
     number_of_questions_to_generate = models.IntegerField(default=0)
     number_of_questions_failed = models.IntegerField(default=0)
     number_of_questions_completed = models.IntegerField(default=0)
@@ -174,24 +243,38 @@ class QuestionConfiguration(models.Model):
     time_taken_in_seconds = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_question_configurations', null=True, blank=True)
-    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_question_configurations', null=True, blank=True)
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_question_configurations', null=True, blank=True, db_index=False)
+    updated_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='updated_question_configurations', null=True, blank=True, db_index=False)
 
     class Meta:
         verbose_name = 'Question Configuration'
         verbose_name_plural = 'Question Configurations'
         db_table = 'question_configurations'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['organization', '-created_at'], name='qconfig_org_created_idx')
+        ]
 
     def __str__(self):
-        return self.name
-
-    def save(self, request=None, *args, **kwargs):
-        if request:
-            if not self.created_by:
-                self.created_by = request.user
-            if not self.updated_by:
-                self.updated_by = request.user
-            if not self.organization:
-                self.organization = request.user.organization
-        super().save(*args, **kwargs)
\ No newline at end of file
+        return loaded_str(self)
+
+
+# Part of every cached list COUNT(*) key for the model; replacing it orphans them all
+def list_count_cache_version_key(model):
+    return f'qb:list_count_version:{model._meta.label_lower}'
+
+
+def list_count_cache_version(model):
+    return cache.get_or_set(list_count_cache_version_key(model), time.time_ns, None)
+
+
+def clear_list_count_cache(model):
+    # bulk_create sends no signals, so bulk inserts call this themselves. Replaced on commit,
+    # so a count taken before then is never cached under the new version
+    transaction.on_commit(lambda: cache.set(list_count_cache_version_key(model), time.time_ns(), None))
+
+
+@receiver([post_save, post_delete], sender=Question)
+@receiver([post_save, post_delete], sender=QuestionConfiguration)
+def clear_list_count_cache_on_change(sender, **kwargs):
+    clear_list_count_cache(sender)
@@ -1,30 +1,151 @@
 import requests
+from requests.adapters import HTTPAdapter
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, Optional
 import logging
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Connection settings are resolved once at import instead of per OllamaService()
+_BASE_URL = getattr(settings, 'OLLAMA_BASE_URL', os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')).rstrip('/')
+_MODEL = getattr(settings, 'OLLAMA_MODEL', os.getenv('OLLAMA_MODEL', 'llama3.2'))
+_TIMEOUT = int(getattr(settings, 'OLLAMA_TIMEOUT', os.getenv('OLLAMA_TIMEOUT', '300')))
+_CONCURRENCY = max(1, int(getattr(settings, 'OLLAMA_CONCURRENCY', os.getenv('OLLAMA_CONCURRENCY', '4'))))
+
+SUBTOPIC_NAME_CACHE_TIMEOUT = 60 * 60 * 24
+
+# One keep-alive pool per process, shared by every OllamaService instance so that
+# short-lived services (e.g. one per Celery task) reuse warm connections
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=_CONCURRENCY, pool_maxsize=_CONCURRENCY))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=_CONCURRENCY, pool_maxsize=_CONCURRENCY))
+
+# Process-wide worker pool for question generation. Every batch queues on it, so
+# concurrent batches never put more than OLLAMA_CONCURRENCY requests in flight
+_GENERATION_POOL = ThreadPoolExecutor(max_workers=_CONCURRENCY, thread_name_prefix='ollama')
+
+# Prompt text is built once at import; only the per-call fields are filled in
+_DIFFICULTY_INSTRUCTIONS = {
+    'easy': """EASY difficulty questions should be:
+            - Simple, straightforward questions that test basic knowledge
+            - Examples: "What is Python?", "What is a variable?", "Explain what is a function?"
+            - Should be answerable in 30-60 seconds
+            - Focus on fundamental concepts and definitions
+            - Avoid complex design or architecture questions
+            - Questions should be clear and direct, suitable for voice-based interviews""",
+    'medium': """MEDIUM difficulty questions should be:
+            - Somewhat challenging conceptual questions
+            - Can include explanatory questions that require understanding
+            - Can include design questions that test practical application
+            - Examples: "How does Python handle memory management?", "Design a simple REST API"
+            - Should be answerable in 60-120 seconds
+            - Test both knowledge and ability to explain concepts""",
+    'hard': """HARD difficulty questions should be:
+            - Tricky questions that test deep domain knowledge
+            - Complex conceptual questions requiring advanced understanding
+            - Questions that test problem-solving and critical thinking
+            - Examples: "Explain the trade-offs between different database indexing strategies"
+            - Should be answerable in 120-180 seconds
+            - Focus on advanced concepts, edge cases, and deep technical knowledge"""
+}
+
+# Ordered from most to least shared: fixed instructions, then the per-configuration
+# context, then the difficulty. Ollama can then reuse the KV cache of the common
+# prefix instead of re-processing it for every question.
+_QUESTION_PROMPT_TEMPLATE = """You are an expert interview question generator for technical assessments.
+            Generate a comprehensive interview question with the following structure:
+            1. A clear, well-formulated question that tests knowledge and understanding
+            2. An expected answer that covers key points
+            3. Important keywords that should appear in a good answer
+            4. An estimated time (in seconds) a candidate should take to answer
+            5. Red flags that indicate poor answers
+            6. An ideal answer summary
+            Return your response as a JSON object with the following structure:
+            {{
+                "question": "The interview question text",
+                "expected_answer": "A comprehensive expected answer covering all important aspects",
+                "keywords": ["keyword1", "keyword2", "keyword3", ...],
+                "time_in_seconds": 120,
+                "red_flags": ["red flag 1", "red flag 2", ...],
+                "ideal_answer_summary": "A concise summary of what an ideal answer should contain"
+            }}
+            IMPORTANT: For EASY questions, generate simple, direct questions like "What is X?" or "Explain Y in simple terms".
+            Context:
+            {context_str}
+            The question should be specific to {topic_name}{subtopic_clause}.
+            Difficulty Level: {difficulty_upper}
+            
+            {difficulty_guide}
+        """
+
+_SUBTOPIC_PROMPT_TEMPLATE = """You are an expert at categorizing technical knowledge domains.
+
+            Category: {category_name}
+            Topic: {topic_name}{description_context}
+            Generate a specific, relevant subtopic name that would be appropriate for this topic.
+            The subtopic should be:
+            1. Specific and focused (not too broad)
+            2. Relevant to the topic and category
+            3. A single, concise name (2-5 words maximum)
+            4. Professional and appropriate for interview questions
+            Return ONLY the subtopic name as a plain text string, nothing else.
+            Do not include any explanations, prefixes, or additional text.
+            Just the subtopic name.
+
+            Example: If Category is "Software Engineering" and Topic is "Full Stack Developer", 
+            a good subtopic might be "Django Framework" or "React Components" or "Database Design".
+            Subtopic name:
+        """
+
+
+_JSON_DECODER = json.JSONDecoder()
+_REQUIRED_QUESTION_FIELDS = frozenset(('question', 'expected_answer', 'keywords', 'time_in_seconds'))
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.S)
+
+
+def _decode_first_object(text: str):
+    """Decode the first JSON object in text, ignoring prose or fences around it"""
+    start = text.find('{')
+    if start != -1:
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            pass
+    fenced = _FENCE_RE.search(text)
+    if fenced:
+        return json.loads(fenced.group(1))
+    return json.loads(text)
+
 
 class OllamaService:
+    # Upper bound on a streamed completion before it is treated as runaway output
+    MAX_STREAM_CHARS = 20000
+
     def __init__(self):
-        self.base_url = getattr(settings, 'OLLAMA_BASE_URL', os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434'))
-        self.model = getattr(settings, 'OLLAMA_MODEL', os.getenv('OLLAMA_MODEL', 'llama3.2'))
-        self.timeout = int(getattr(settings, 'OLLAMA_TIMEOUT', os.getenv('OLLAMA_TIMEOUT', '300')))
+        self.base_url = _BASE_URL
+        self.model = _MODEL
+        self.timeout = _TIMEOUT
+        self.concurrency = _CONCURRENCY
+        self.session = _SESSION
 
     def _make_request(self, endpoint: str, data: Dict) -> Optional[Dict]:
         try:
-            base_url = self.base_url.rstrip('/')
             endpoint = endpoint if endpoint.startswith('/') else f'/{endpoint}'
-            url = f"{base_url}{endpoint}"
+            url = f"{self.base_url}{endpoint}"
             
-            logger.info(f"Making Ollama request to: {url}")
-            logger.info(f"Using model: {data.get('model', 'unknown')}")
-            logger.debug(f"Request data: {data}")
+            logger.debug("Making Ollama request to: %s (model: %s)", url, data.get('model', 'unknown'))
+            logger.debug("Request data: %s", data)
             
-            response = requests.post(
+            if data.get('stream'):
+                return self._read_stream(url, data)
+            
+            response = self.session.post(
                 url,
                 json=data,
                 timeout=self.timeout
@@ -49,6 +170,61 @@ class OllamaService:
         except requests.exceptions.RequestException as e:
             logger.error(f"Ollama API request failed: {str(e)}")
             return None
+        except json.JSONDecodeError as e:
+            logger.error(f"Ollama API returned a malformed stream chunk: {str(e)}")
+            return None
+
+    def _read_stream(self, url: str, data: Dict) -> Optional[Dict]:
+        """
+        Read a streamed generation and stop as soon as a complete JSON object has arrived.
+        
+        Closing the response early makes Ollama cancel the rest of the generation, which
+        for JSON-formatted prompts is usually trailing whitespace up to the token limit.
+        """
+        with self.session.post(url, json=data, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            text = []
+            length = 0
+            depth = 0
+            in_string = False
+            escaped = False
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                piece = chunk.get('response', '')
+                if chunk.get('done'):
+                    text.append(piece)
+                    break
+                length += len(piece)
+                if length > self.MAX_STREAM_CHARS:
+                    logger.warning(f"Ollama response exceeded {self.MAX_STREAM_CHARS} characters, aborting")
+                    return None
+                
+                # Track brace depth outside of JSON strings to spot the end of the object
+                complete = False
+                for index, char in enumerate(piece):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == '\\':
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"' and depth > 0:
+                        in_string = True
+                    elif char == '{':
+                        depth += 1
+                    elif char == '}' and depth > 0:
+                        depth -= 1
+                        if depth == 0:
+                            complete = True
+                            piece = piece[:index + 1]
+                            break
+                text.append(piece)
+                if complete:
+                    break
+            return {'response': ''.join(text), 'done': True}
 
     def generate_question(
         self,
@@ -64,63 +240,20 @@ class OllamaService:
         if context:
             context_str += f"\nAdditional Context: {context}"
         
-        difficulty_instructions = {
-            'easy': """EASY difficulty questions should be:
-            - Simple, straightforward questions that test basic knowledge
-            - Examples: "What is Python?", "What is a variable?", "Explain what is a function?"
-            - Should be answerable in 30-60 seconds
-            - Focus on fundamental concepts and definitions
-            - Avoid complex design or architecture questions
-            - Questions should be clear and direct, suitable for voice-based interviews""",
-            'medium': """MEDIUM difficulty questions should be:
-            - Somewhat challenging conceptual questions
-            - Can include explanatory questions that require understanding
-            - Can include design questions that test practical application
-            - Examples: "How does Python handle memory management?", "Design a simple REST API"
-            - Should be answerable in 60-120 seconds
-            - Test both knowledge and ability to explain concepts""",
-            'hard': """HARD difficulty questions should be:
-            - Tricky questions that test deep domain knowledge
-            - Complex conceptual questions requiring advanced understanding
-            - Questions that test problem-solving and critical thinking
-            - Examples: "Explain the trade-offs between different database indexing strategies"
-            - Should be answerable in 120-180 seconds
-            - Focus on advanced concepts, edge cases, and deep technical knowledge"""
-        }
-        
-        difficulty_guide = difficulty_instructions.get(difficulty.lower(), difficulty_instructions['medium'])
+        difficulty_guide = _DIFFICULTY_INSTRUCTIONS.get(difficulty.lower(), _DIFFICULTY_INSTRUCTIONS['medium'])
         
-        prompt = f"""You are an expert interview question generator for technical assessments.
-            Context:
-            {context_str}
-            Difficulty Level: {difficulty.upper()}
-            
-            {difficulty_guide}
-            
-            Generate a comprehensive interview question with the following structure:
-            1. A clear, well-formulated question that tests knowledge and understanding
-            2. An expected answer that covers key points
-            3. Important keywords that should appear in a good answer
-            4. An estimated time (in seconds) a candidate should take to answer
-            5. Red flags that indicate poor answers
-            6. An ideal answer summary
-            Return your response as a JSON object with the following structure:
-            {{
-                "question": "The interview question text",
-                "expected_answer": "A comprehensive expected answer covering all important aspects",
-                "keywords": ["keyword1", "keyword2", "keyword3", ...],
-                "time_in_seconds": 120,
-                "red_flags": ["red flag 1", "red flag 2", ...],
-                "ideal_answer_summary": "A concise summary of what an ideal answer should contain"
-            }}
-            The question should be specific to {topic_name}{' and ' + subtopic_name if subtopic_name else ''}.
-            IMPORTANT: For EASY questions, generate simple, direct questions like "What is X?" or "Explain Y in simple terms".
-        """
+        prompt = _QUESTION_PROMPT_TEMPLATE.format_map({
+            'context_str': context_str,
+            'difficulty_upper': difficulty.upper(),
+            'difficulty_guide': difficulty_guide,
+            'topic_name': topic_name,
+            'subtopic_clause': f' and {subtopic_name}' if subtopic_name else ''
+        })
 
         data = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "format": "json"
         }
 
@@ -129,13 +262,8 @@ class OllamaService:
         if response and 'response' in response:
             try:
                 response_text = response['response']
-                if '```json' in response_text:
-                    response_text = response_text.split('```json')[1].split('```')[0].strip()
-                elif '```' in response_text:
-                    response_text = response_text.split('```')[1].split('```')[0].strip()
-                question_data = json.loads(response_text)
-                required_fields = ['question', 'expected_answer', 'keywords', 'time_in_seconds']
-                if all(field in question_data for field in required_fields):
+                question_data = _decode_first_object(response_text)
+                if isinstance(question_data, dict) and _REQUIRED_QUESTION_FIELDS <= question_data.keys():
                     question_data.setdefault('red_flags', [])
                     question_data.setdefault('ideal_answer_summary', '')
                     return question_data
@@ -155,28 +283,23 @@ class OllamaService:
         topic_name: str,
         topic_description: Optional[str] = None
     ) -> Optional[str]:
+        cache_key = 'ollama:subtopic:' + hashlib.blake2b(
+            f'{self.model}|{category_name}|{topic_name}|{topic_description or ""}'.encode(),
+            digest_size=16
+        ).hexdigest()
+        cached_name = cache.get(cache_key)
+        if cached_name:
+            return cached_name
+        
         description_context = ""
         if topic_description:
             description_context = f"\nTopic Description: {topic_description}"
         
-        prompt = f"""You are an expert at categorizing technical knowledge domains.
-
-            Category: {category_name}
-            Topic: {topic_name}{description_context}
-            Generate a specific, relevant subtopic name that would be appropriate for this topic.
-            The subtopic should be:
-            1. Specific and focused (not too broad)
-            2. Relevant to the topic and category
-            3. A single, concise name (2-5 words maximum)
-            4. Professional and appropriate for interview questions
-            Return ONLY the subtopic name as a plain text string, nothing else.
-            Do not include any explanations, prefixes, or additional text.
-            Just the subtopic name.
-
-            Example: If Category is "Software Engineering" and Topic is "Full Stack Developer", 
-            a good subtopic might be "Django Framework" or "React Components" or "Database Design".
-            Subtopic name:
-        """
+        prompt = _SUBTOPIC_PROMPT_TEMPLATE.format_map({
+            'category_name': category_name,
+            'topic_name': topic_name,
+            'description_context': description_context
+        })
 
         data = {
             "model": self.model,
@@ -194,6 +317,7 @@ class OllamaService:
                 subtopic_name = subtopic_name.split('\n')[0].strip()
                 
                 if subtopic_name and len(subtopic_name) > 0:
+                    cache.set(cache_key, subtopic_name, SUBTOPIC_NAME_CACHE_TIMEOUT)
                     return subtopic_name
                 else:
                     logger.warning("Generated subtopic name is empty")
@@ -212,19 +336,35 @@ class OllamaService:
         difficulty: str,
         count: int,
         context: Optional[str] = None
-    ) -> List[Dict]:
-        questions = []
-        for i in range(count):
-            question = self.generate_question(
+    ) -> Iterator[Dict]:
+        """Yield each generated question as soon as its worker finishes"""
+        if count <= 0:
+            return
+        
+        def generate(_):
+            return self.generate_question(
                 category_name=category_name,
                 topic_name=topic_name,
                 subtopic_name=subtopic_name,
                 difficulty=difficulty,
                 context=context
             )
-            if question:
-                questions.append(question)
-            else:
-                logger.warning(f"Failed to generate question {i+1}/{count}")
-        return questions
+        
+        # Each call mostly waits on the model, so run them side by side
+        futures = [_GENERATION_POOL.submit(generate, i) for i in range(count)]
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                try:
+                    question = future.result()
+                except Exception as e:
+                    logger.error(f"Question generation worker failed: {str(e)}", exc_info=True)
+                    question = None
+                if question:
+                    yield question
+                else:
+                    logger.warning(f"Failed to generate question ({done}/{count} finished)")
+        finally:
+            # Drop calls that have not started if the caller stops consuming early
+            for future in futures:
+                future.cancel()
 
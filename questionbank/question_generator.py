@@ -2,12 +2,20 @@ import threading
 import time
 import logging
 import difflib
-from typing import Dict, Optional, Tuple
-from django.db import transaction
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from .models import (
     Question, QuestionConfiguration, QuestionConfigurationStatus,
-    Category, Topic, Subtopic, DifficultyLevel
+    Category, Topic, Subtopic, DifficultyLevel, clear_list_count_cache
 )
 from .ollama_service import OllamaService
 from .weightage_calculator import WeightageCalculator
@@ -15,6 +23,14 @@ from authentication.models import User
 
 logger = logging.getLogger(__name__)
 
+QUESTION_BULK_CREATE_BATCH_SIZE = 500
+# How many pg_trgm matches are re-scored with difflib in the similarity checks
+SIMILARITY_CANDIDATE_LIMIT = 10
+# Normalized texts already found to be duplicates, kept per generator run
+DUPLICATE_CACHE_SIZE = 4096
+# Over-requesting rounds per batch; each round asks for ~1.5x the questions still missing
+MAX_GENERATION_ROUNDS = 3
+
 
 class QuestionGenerator:
     def __init__(self):
@@ -22,6 +38,9 @@ class QuestionGenerator:
         self.weightage_calculator = WeightageCalculator()
         self.similarity_threshold = 0.8
         self.question_similarity_threshold = 0.85
+        # blake2b(normalized text) -> uuid of the question it duplicates; shared by the batch threads
+        self._known_duplicates = OrderedDict()
+        self._known_duplicates_lock = threading.Lock()
     
     def _find_similar_subtopic(
         self, 
@@ -32,21 +51,31 @@ class QuestionGenerator:
         if threshold is None:
             threshold = self.similarity_threshold
         
-        existing_subtopics = Subtopic.objects.filter(topic=topic)
-        if not existing_subtopics.exists():
-            return None
+        normalized_search_name = subtopic_name.lower().strip(' ')
+        existing_subtopics = Subtopic.objects.filter(
+            topic=topic,
+            name_normalized__trigram_similar=normalized_search_name
+        ).annotate(
+            similarity=TrigramSimilarity('name_normalized', normalized_search_name)
+        ).order_by('-similarity')[:SIMILARITY_CANDIDATE_LIMIT]
         
-        normalized_search_name = subtopic_name.lower().strip()
+        matcher = difflib.SequenceMatcher(None)
+        matcher.set_seq2(normalized_search_name)
         best_match = None
         best_ratio = 0.0
         
         for subtopic in existing_subtopics:
-            normalized_subtopic_name = subtopic.name.lower().strip()
-            ratio = difflib.SequenceMatcher(
-                None, 
-                normalized_search_name, 
-                normalized_subtopic_name
-            ).ratio()
+            normalized_subtopic_name = subtopic.name_normalized
+            if normalized_subtopic_name == normalized_search_name:
+                # SequenceMatcher has no fast path for identical input
+                best_match, best_ratio = subtopic, 1.0
+                break
+            matcher.set_seq1(normalized_subtopic_name)
+            # real_quick_ratio/quick_ratio are cheap upper bounds on ratio(); skip hopeless pairs
+            floor = max(threshold, best_ratio)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            ratio = matcher.ratio()
             
             if ratio > best_ratio and ratio >= threshold:
                 best_ratio = ratio
@@ -61,29 +90,6 @@ class QuestionGenerator:
         
         return None
     
-    def generate_questions_async(
-        self,
-        config_uuid: str,
-        category_uuid: str,
-        topic_uuid: str,
-        subtopic_uuid: Optional[str],
-        total_questions: int,
-        difficulty_partitions: Dict[str, float],
-        user: User
-    ):
-        logger.info(f"[CONFIG {config_uuid}] Starting async question generation thread")
-        logger.info(f"[CONFIG {config_uuid}] Parameters: total={total_questions}, partitions={difficulty_partitions}")
-        thread = threading.Thread(
-            target=self._generate_questions,
-            args=(
-                config_uuid, category_uuid, topic_uuid, subtopic_uuid,
-                total_questions, difficulty_partitions, user
-            ),
-            daemon=True
-        )
-        thread.start()
-        logger.info(f"[CONFIG {config_uuid}] Thread started successfully")
-    
     def _generate_questions(
         self,
         config_uuid: str,
@@ -96,7 +102,6 @@ class QuestionGenerator:
     ):
         start_time = time.time()
         logger.info(f"[CONFIG {config_uuid}] ========== QUESTION GENERATION STARTED ==========")
-        logger.info(f"[CONFIG {config_uuid}] Thread ID: {threading.current_thread().ident}")
         logger.info(f"[CONFIG {config_uuid}] Total questions to generate: {total_questions}")
         logger.info(f"[CONFIG {config_uuid}] Difficulty partitions: {difficulty_partitions}")
         
@@ -147,12 +152,11 @@ class QuestionGenerator:
                             f"(similarity: {similarity_ratio:.2f}) for generated name: '{subtopic_name}'"
                         )
                     else:
-                        subtopic = Subtopic.objects.create(
+                        subtopic = Subtopic.create_for_user(
+                            user,
                             name=subtopic_name,
                             description=f"Auto-generated subtopic for {topic.name}",
-                            topic=topic,
-                            created_by=user,
-                            updated_by=user
+                            topic=topic
                         )
                         logger.info(f"[CONFIG {config_uuid}] Created new subtopic: {subtopic_name} (UUID: {subtopic.uuid})")
                     
@@ -176,33 +180,34 @@ class QuestionGenerator:
             
             batch_size = 10
             all_questions = []
+            difficulty_counts = [
+                (DifficultyLevel.EASY, easy_count),
+                (DifficultyLevel.MEDIUM, medium_count),
+                (DifficultyLevel.HARD, hard_count),
+            ]
+            difficulty_counts = [(difficulty, count) for difficulty, count in difficulty_counts if count > 0]
             
-            if easy_count > 0:
-                logger.info(f"[CONFIG {config_uuid}] Starting EASY questions generation ({easy_count} questions)")
-                easy_questions = self._generate_difficulty_batch(
-                    category, topic, subtopic, DifficultyLevel.EASY,
-                    easy_count, batch_size, user, config
-                )
-                all_questions.extend(easy_questions)
-                logger.info(f"[CONFIG {config_uuid}] Completed EASY questions: {len(easy_questions)}/{easy_count}")
-            
-            if medium_count > 0:
-                logger.info(f"[CONFIG {config_uuid}] Starting MEDIUM questions generation ({medium_count} questions)")
-                medium_questions = self._generate_difficulty_batch(
-                    category, topic, subtopic, DifficultyLevel.MEDIUM,
-                    medium_count, batch_size, user, config
-                )
-                all_questions.extend(medium_questions)
-                logger.info(f"[CONFIG {config_uuid}] Completed MEDIUM questions: {len(medium_questions)}/{medium_count}")
+            def generate_difficulty(difficulty, count):
+                logger.info(f"[CONFIG {config_uuid}] Starting {difficulty.upper()} questions generation ({count} questions)")
+                try:
+                    questions = self._generate_difficulty_batch(
+                        category, topic, subtopic, difficulty,
+                        count, batch_size, user, config
+                    )
+                finally:
+                    connection.close()
+                logger.info(f"[CONFIG {config_uuid}] Completed {difficulty.upper()} questions: {len(questions)}/{count}")
+                return questions
             
-            if hard_count > 0:
-                logger.info(f"[CONFIG {config_uuid}] Starting HARD questions generation ({hard_count} questions)")
-                hard_questions = self._generate_difficulty_batch(
-                    category, topic, subtopic, DifficultyLevel.HARD,
-                    hard_count, batch_size, user, config
-                )
-                all_questions.extend(hard_questions)
-                logger.info(f"[CONFIG {config_uuid}] Completed HARD questions: {len(hard_questions)}/{hard_count}")
+            # The difficulties are independent and mostly wait on Ollama, so run them side by side
+            if difficulty_counts:
+                with ThreadPoolExecutor(max_workers=len(difficulty_counts)) as executor:
+                    futures = [
+                        executor.submit(generate_difficulty, difficulty, count)
+                        for difficulty, count in difficulty_counts
+                    ]
+                    for future in futures:
+                        all_questions.extend(future.result())
             
             elapsed_time = int(time.time() - start_time)
             logger.info(f"[CONFIG {config_uuid}] Finalizing: Generated {len(all_questions)}/{total_questions} questions in {elapsed_time} seconds")
@@ -260,196 +265,262 @@ class QuestionGenerator:
             context += f", Subtopic: {subtopic.name}"
         
         total_batches = (count + batch_size - 1) // batch_size
+        # Same scope for every duplicate check in this difficulty; filter(subtopic=None) is IS NULL
+        question_pool = Question.objects.filter(category=category, topic=topic, subtopic=subtopic)
         logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Starting batch generation: {count} questions in {total_batches} batch(es)")
         
-        for batch_start in range(0, count, batch_size):
-            batch_end = min(batch_start + batch_size, count)
-            batch_count = batch_end - batch_start
-            batch_num = batch_start//batch_size + 1
-            
-            logger.info(
-                f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}/{total_batches}: "
-                f"Generating {batch_count} questions (range: {batch_start+1}-{batch_end})"
-            )
-            
-            with transaction.atomic():
-                config.refresh_from_db()
-                old_pending = config.number_of_questions_pending
-                old_in_progress = config.number_of_questions_in_progress
-                config.number_of_questions_in_progress = batch_count
-                config.number_of_questions_pending = (
-                    config.number_of_questions_pending - batch_count
+        def run_batch(batch_start):
+            try:
+                return self._generate_single_batch(
+                    category, topic, subtopic, difficulty, user, config,
+                    question_pool, context, batch_start,
+                    min(batch_start + batch_size, count), batch_size, total_batches
                 )
-                config.save()
-                logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Updated status - "
-                           f"Pending: {old_pending} -> {config.number_of_questions_pending}, "
-                           f"In Progress: {old_in_progress} -> {config.number_of_questions_in_progress}")
+            finally:
+                connection.close()
+        
+        # Batches are queued on the shared Ollama pool, so a batch that finishes
+        # early frees its slots for the next one instead of waiting for stragglers
+        with ThreadPoolExecutor(max_workers=min(self.ollama_service.concurrency, total_batches)) as executor:
+            for batch_questions in executor.map(run_batch, range(0, count, batch_size)):
+                generated_questions.extend(batch_questions)
+        
+        logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] All batches completed: {len(generated_questions)}/{count} questions generated")
+        return generated_questions
+    
+    def _generate_single_batch(
+        self,
+        category: Category,
+        topic: Topic,
+        subtopic: Optional[Subtopic],
+        difficulty: str,
+        user: User,
+        config: QuestionConfiguration,
+        question_pool,
+        context: str,
+        batch_start: int,
+        batch_end: int,
+        batch_size: int,
+        total_batches: int
+    ) -> list:
+        config_uuid = str(config.uuid)
+        batch_questions = []
+        batch_count = batch_end - batch_start
+        batch_num = batch_start//batch_size + 1
+        # Built once per batch; the per-question logs below are DEBUG with lazy %-args
+        log_prefix = f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}"
+        
+        logger.info(
+            "%s/%s: Generating %s questions (range: %s-%s)",
+            log_prefix, total_batches, batch_count, batch_start + 1, batch_end
+        )
+        
+        self._add_to_config_counters(config, pending=-batch_count, in_progress=batch_count)
+        logger.debug("%s: Moved %s question(s) from pending to in progress", log_prefix, batch_count)
+        
+        questions_needed = batch_count
+        generation_round = 0
+        processed_questions = 0
+        duplicate_count = 0
+        subtopic_name = subtopic.name if subtopic else None
+        
+        while processed_questions < questions_needed and generation_round < MAX_GENERATION_ROUNDS:
+            questions_to_generate = questions_needed - processed_questions
+            # Ask for extras up front so duplicates and invalid answers are usually
+            # covered without another round of Ollama calls
+            over_request = max(questions_to_generate, int(questions_to_generate * 1.5) + 2)
+            generation_round += 1
+            logger.debug("%s: Generating %s question(s) for %s needed (round %s/%s)",
+                         log_prefix, over_request, questions_to_generate, generation_round, MAX_GENERATION_ROUNDS)
             
-            questions_needed = batch_count
-            max_ollama_calls = batch_count * 3  
-            ollama_call_count = 0
-            processed_questions = 0
-            duplicate_count = 0
+            # Questions arrive as each Ollama call finishes, so the duplicate checks
+            # below overlap with the calls still in flight
+            ollama_questions = self.ollama_service.generate_questions_batch(
+                category_name=category.name,
+                topic_name=topic.name,
+                subtopic_name=subtopic_name,
+                difficulty=difficulty,
+                count=over_request,
+                context=context
+            )
             
-            while processed_questions < questions_needed and ollama_call_count < max_ollama_calls:
-                questions_to_generate = questions_needed - processed_questions
-                ollama_call_count += 1
-                logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Generating {questions_to_generate} question(s) (Ollama call {ollama_call_count}/{max_ollama_calls})")
-                
+            new_questions = []
+            failed_in_call = 0
+            received = 0
+            for ollama_q in ollama_questions:
+                received += 1
                 try:
-                    ollama_questions = self.ollama_service.generate_questions_batch(
-                        category_name=category.name,
-                        topic_name=topic.name,
-                        subtopic_name=subtopic.name if subtopic else None,
-                        difficulty=difficulty,
-                        count=questions_to_generate,
-                        context=context
+                    question_text = ollama_q.get('question', '')
+                    if not question_text:
+                        logger.warning("%s: Empty question text, skipping", log_prefix)
+                        failed_in_call += 1
+                        continue
+                    
+                    similar_question_uuid = self._find_similar_question(
+                        question_text=question_text,
+                        question_pool=question_pool,
+                        pending_questions=new_questions
                     )
-                    logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Ollama returned {len(ollama_questions)} question(s)")
-                except Exception as ollama_error:
-                    logger.error(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Ollama service error: {str(ollama_error)}", exc_info=True)
-                    ollama_questions = []
-                    # Mark failed questions
-                    failed_count = questions_to_generate
-                    with transaction.atomic():
-                        config.refresh_from_db()
-                        config.number_of_questions_failed += failed_count
-                        config.number_of_questions_in_progress -= failed_count
-                        config.save()
-                    logger.error(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Marked {failed_count} questions as failed due to Ollama error")
-                    break
-                
-                for ollama_q in ollama_questions:
-                    try:
-                        question_text = ollama_q.get('question', '')
-                        if not question_text:
-                            logger.warning(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Empty question text, skipping")
-                            with transaction.atomic():
-                                config.refresh_from_db()
-                                config.number_of_questions_failed += 1
-                                config.number_of_questions_in_progress -= 1
-                                config.save()
-                            continue
-                        
-                        similar_question = self._find_similar_question(
-                            question_text=question_text,
-                            category=category,
-                            topic=topic,
-                            subtopic=subtopic
-                        )
-                        
-                        if similar_question:
-                            duplicate_count += 1
-                            logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Duplicate question detected (similarity >= {self.question_similarity_threshold})")
-                            logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Similar question UUID: {similar_question.uuid}, Question: '{question_text[:80]}...'")
-                            logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Skipping duplicate, will generate replacement in next iteration")
-                            continue
-                        
-                        question = self._create_question_from_ollama(
-                            ollama_q, category, topic, subtopic,
-                            difficulty, user
+                    
+                    if similar_question_uuid:
+                        duplicate_count += 1
+                        logger.debug(
+                            "%s: Skipping duplicate (similarity >= %s) of question %s: '%.80s...'",
+                            log_prefix, self.question_similarity_threshold, similar_question_uuid, question_text
                         )
-                        
-                        if question:
-                            generated_questions.append(question)
-                            processed_questions += 1
-                            logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Question {processed_questions}/{questions_needed} created successfully (UUID: {question.uuid})")
-                            
-                            with transaction.atomic():
-                                config.refresh_from_db()
-                                old_completed = config.number_of_questions_completed
-                                old_in_progress = config.number_of_questions_in_progress
-                                config.number_of_questions_completed += 1
-                                config.number_of_questions_in_progress -= 1
-                                config.save()
-                                logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Status updated - "
-                                           f"Completed: {old_completed} -> {config.number_of_questions_completed}, "
-                                           f"In Progress: {old_in_progress} -> {config.number_of_questions_in_progress}")
-                        else:
-                            logger.warning(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Question creation returned None (invalid data)")
-                            with transaction.atomic():
-                                config.refresh_from_db()
-                                config.number_of_questions_failed += 1
-                                config.number_of_questions_in_progress -= 1
-                                config.save()
-                    except Exception as e:
-                        logger.error(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Error processing question: {str(e)}", exc_info=True)
-                        with transaction.atomic():
-                            config.refresh_from_db()
-                            config.number_of_questions_failed += 1
-                            config.number_of_questions_in_progress -= 1
-                            config.save()
+                        continue
+                    
+                    question = self._build_question_from_ollama(
+                        ollama_q, category, topic, subtopic,
+                        difficulty, user
+                    )
+                    
+                    if question:
+                        new_questions.append(question)
+                        if len(new_questions) == questions_to_generate:
+                            break
+                    else:
+                        logger.warning("%s: Question creation returned None (invalid data)", log_prefix)
+                        failed_in_call += 1
+                except Exception as e:
+                    logger.error("%s: Error processing question: %s", log_prefix, e, exc_info=True)
+                    failed_in_call += 1
+            
+            # Cancel the calls still queued now, not when the generator is garbage collected,
+            # so idle pool workers do not start them during the INSERT below
+            ollama_questions.close()
+            logger.debug("%s: Ollama returned %s question(s)", log_prefix, received)
+            
+            # One INSERT batch and one counter update per round
+            with transaction.atomic():
+                if new_questions:
+                    inserted_questions = self._insert_questions(new_questions)
+                    duplicate_count += len(new_questions) - len(inserted_questions)
+                    new_questions = inserted_questions
                 
-                if processed_questions < questions_needed:
-                    remaining = questions_needed - processed_questions
-                    logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Need {remaining} more question(s) (found {duplicate_count} duplicates so far), continuing generation...")
+                processed_after_call = processed_questions + len(new_questions)
+                # The last round of the batch also settles the questions it could not fill
+                if processed_after_call >= questions_needed or generation_round >= MAX_GENERATION_ROUNDS:
+                    unfilled = questions_needed - processed_after_call
+                else:
+                    unfilled = 0
+                
+                if new_questions or unfilled:
+                    self._add_to_config_counters(
+                        config,
+                        completed=len(new_questions),
+                        failed=unfilled,
+                        in_progress=-(len(new_questions) + unfilled)
+                    )
+            
+            batch_questions.extend(new_questions)
+            processed_questions = processed_after_call
+            if new_questions:
+                logger.debug("%s: %s/%s questions created (%s completed, %s invalid in this round)",
+                             log_prefix, processed_questions, questions_needed, len(new_questions), failed_in_call)
             
             if processed_questions < questions_needed:
                 remaining = questions_needed - processed_questions
-                logger.warning(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Could not generate all {questions_needed} questions. Generated {processed_questions}/{questions_needed} (found {duplicate_count} duplicates)")
-                with transaction.atomic():
-                    config.refresh_from_db()
-                    config.number_of_questions_failed += remaining
-                    config.number_of_questions_in_progress -= remaining
-                    config.save()
-            elif duplicate_count > 0:
-                logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num}: Successfully generated all {questions_needed} questions (skipped {duplicate_count} duplicates)")
-            
-            logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] Batch {batch_num} completed: {len(generated_questions)} questions generated so far")
+                logger.debug("%s: Need %s more question(s) (found %s duplicates so far), continuing generation...",
+                             log_prefix, remaining, duplicate_count)
         
-        logger.info(f"[CONFIG {config_uuid}] [{difficulty.upper()}] All batches completed: {len(generated_questions)}/{count} questions generated")
-        return generated_questions
+        if processed_questions < questions_needed:
+            logger.warning("%s: Could not generate all %s questions. Generated %s/%s (found %s duplicates)",
+                           log_prefix, questions_needed, processed_questions, questions_needed, duplicate_count)
+        elif duplicate_count > 0:
+            logger.info("%s: Successfully generated all %s questions (skipped %s duplicates)",
+                        log_prefix, questions_needed, duplicate_count)
+        
+        logger.info("%s completed: %s questions generated so far", log_prefix, len(batch_questions))
+        return batch_questions
+    
+    def _insert_questions(self, questions: List[Question]) -> List[Question]:
+        """
+        Bulk-insert questions, skipping exact duplicates of existing rows in the same pool.
+
+        unique_question_text_per_pool rejects them inside the INSERT, which also covers
+        questions written by a concurrent run. ignore_conflicts leaves no primary keys
+        behind, so the survivors are looked up by their client-side uuid.
+        """
+        Question.objects.bulk_create(questions, batch_size=QUESTION_BULK_CREATE_BATCH_SIZE, ignore_conflicts=True)
+        clear_list_count_cache(Question)
+        inserted_uuids = set(
+            Question.objects.filter(uuid__in=[question.uuid for question in questions]).values_list('uuid', flat=True)
+        )
+        return [question for question in questions if question.uuid in inserted_uuids]
+    
+    def _add_to_config_counters(self, config: QuestionConfiguration, **deltas):
+        """Apply deltas such as completed=3, in_progress=-3 to the number_of_questions_* columns in one UPDATE"""
+        QuestionConfiguration.objects.filter(pk=config.pk).update(
+            updated_at=timezone.now(),
+            **{
+                f'number_of_questions_{name}': F(f'number_of_questions_{name}') + delta
+                for name, delta in deltas.items()
+            }
+        )
     
     def _find_similar_question(
         self,
         question_text: str,
-        category: Category,
-        topic: Topic,
-        subtopic: Optional[Subtopic],
-        threshold: float = None
-    ) -> Optional[Question]:
+        question_pool,
+        threshold: float = None,
+        pending_questions: Optional[List[Question]] = None
+    ) -> Optional[UUID]:
+        """UUID of a question in question_pool, or one about to be inserted, that is close to question_text"""
         if threshold is None:
             threshold = self.question_similarity_threshold
         
-        existing_questions = Question.objects.filter(
-            category=category,
-            topic=topic
-        )
+        normalized_question_text = question_text.lower().strip(' ')
+        # Ollama often repeats itself; a text seen as a duplicate once needs no new lookup.
+        # Only matches are cached: a miss goes stale as soon as the question is inserted.
+        cache_key = hashlib.blake2b(normalized_question_text.encode(), digest_size=8).digest()
+        with self._known_duplicates_lock:
+            cached_uuid = self._known_duplicates.get(cache_key)
+            if cached_uuid is not None:
+                self._known_duplicates.move_to_end(cache_key)
+                return cached_uuid
         
-        if subtopic:
-            existing_questions = existing_questions.filter(subtopic=subtopic)
-        else:
-            existing_questions = existing_questions.filter(subtopic__isnull=True)
+        # The trigram index narrows the pool to a few close candidates; difflib confirms
+        existing_questions = question_pool.filter(
+            question_normalized__trigram_similar=normalized_question_text
+        ).annotate(
+            similarity=TrigramSimilarity('question_normalized', normalized_question_text)
+        ).order_by('-similarity').values_list('uuid', 'question_normalized')[:SIMILARITY_CANDIDATE_LIMIT]
+        pending_candidates = ((q.uuid, q.question_normalized) for q in pending_questions or ())
         
-        if not existing_questions.exists():
-            return None
-        
-        normalized_question_text = question_text.lower().strip()
+        # SequenceMatcher caches its analysis of the second sequence, so set it once
+        matcher = difflib.SequenceMatcher(None)
+        matcher.set_seq2(normalized_question_text)
         best_match = None
         best_ratio = 0.0
         
-        for existing_q in existing_questions:
-            normalized_existing_text = existing_q.question.lower().strip()
-            ratio = difflib.SequenceMatcher(
-                None,
-                normalized_question_text,
-                normalized_existing_text
-            ).ratio()
+        for existing_uuid, normalized_existing_text in chain(existing_questions, pending_candidates):
+            if normalized_existing_text == normalized_question_text:
+                # SequenceMatcher has no fast path for identical input
+                best_match, best_ratio = existing_uuid, 1.0
+                break
+            matcher.set_seq1(normalized_existing_text)
+            # real_quick_ratio/quick_ratio are cheap upper bounds on ratio(); skip hopeless pairs
+            floor = max(threshold, best_ratio)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            ratio = matcher.ratio()
             
             if ratio > best_ratio and ratio >= threshold:
                 best_ratio = ratio
-                best_match = existing_q
+                best_match = existing_uuid
         
         if best_match:
-            logger.info(
-                f"Found similar question (similarity: {best_ratio:.2f}): "
-                f"'{best_match.question[:50]}...'"
-            )
+            logger.debug("Found similar question %s (similarity: %.2f)", best_match, best_ratio)
+            with self._known_duplicates_lock:
+                self._known_duplicates[cache_key] = best_match
+                if len(self._known_duplicates) > DUPLICATE_CACHE_SIZE:
+                    self._known_duplicates.popitem(last=False)
             return best_match
         
         return None
     
-    def _create_question_from_ollama(
+    def _build_question_from_ollama(
         self,
         ollama_data: Dict,
         category: Category,
@@ -458,26 +529,13 @@ class QuestionGenerator:
         difficulty: str,
         user: User
     ) -> Optional[Question]:
+        """Build an unsaved Question from Ollama output; the caller bulk-inserts it"""
         try:
             question_text = ollama_data.get('question', '')
             if not question_text:
                 logger.warning("Empty question text, skipping question creation")
                 return None
             
-            similar_question = self._find_similar_question(
-                question_text=question_text,
-                category=category,
-                topic=topic,
-                subtopic=subtopic
-            )
-            
-            if similar_question:
-                logger.info(
-                    f"Skipping duplicate question. Similar question found: "
-                    f"UUID={similar_question.uuid}, similarity >= {self.question_similarity_threshold}"
-                )
-                return None
-            
             weightages = self.weightage_calculator.calculate_weightages(
                 question=question_text,
                 expected_answer=ollama_data.get('expected_answer', ''),
@@ -495,7 +553,7 @@ class QuestionGenerator:
                 question_name += f" - {subtopic.name}"
             question_name += f" ({difficulty.upper()})"
             
-            question = Question.objects.create(
+            question = Question(
                 name=question_name,
                 description=f"Auto-generated question for {category.name} > {topic.name}",
                 category=category,
@@ -513,10 +571,13 @@ class QuestionGenerator:
                 updated_by=user,
                 **weightages
             )
+            # Postgres computes the column on insert; pending questions are compared before that.
+            # TRIM() only removes spaces, so strip(' ') rather than every kind of whitespace
+            question.question_normalized = question_text.lower().strip(' ')
             
             return question
             
         except Exception as e:
-            logger.error(f"Error creating question from Ollama data: {str(e)}", exc_info=True)
+            logger.error(f"Error building question from Ollama data: {str(e)}", exc_info=True)
             return None
 
@@ -1,54 +1,65 @@
+from uuid import UUID
+from django.db import IntegrityError, transaction
+from django.utils.functional import cached_property
 from rest_framework import serializers
-from .models import Category, Topic, Subtopic, Question, QuestionConfiguration, DifficultyLevel
+from .fields import HundredthsField
+from .models import (
+    Category, Topic, Subtopic, Question, QuestionConfiguration, DifficultyLevel, clear_list_count_cache
+)
 from organizations.models import Organization
 from authentication.models import User
+from utils.serializer_fields import CachedFieldsMixin
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class ContextUserMixin:
+    """Resolves the requesting user from the serializer context once per serializer"""
+
+    @cached_property
+    def context_user(self):
+        request = self.context.get('request')
+        return request.user if request else None
+
+
+class CategorySerializer(ContextUserMixin, CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ['id', 'uuid', 'name', 'description', 'created_at', 'updated_at']
         read_only_fields = ['id', 'uuid', 'created_at', 'updated_at']
     
-    def validate_name(self, value):
-        if self.instance is None:
-            if Category.objects.filter(name__iexact=value).exists():
-                raise serializers.ValidationError("A category with this name already exists.")
-        else:
-            if Category.objects.filter(name__iexact=value).exclude(pk=self.instance.pk).exists():
-                raise serializers.ValidationError("A category with this name already exists.")
-        return value
-    
     def create(self, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
+        user = self.context_user
         
         try:
-            category = Category.objects.create(
-                name=validated_data['name'],
-                description=validated_data.get('description', ''),
-                created_by=user,
-                updated_by=user
-            )
-        except Exception as e:
+            with transaction.atomic():
+                category = Category.create_for_user(
+                    user,
+                    name=validated_data['name'],
+                    description=validated_data.get('description', '')
+                )
+        except IntegrityError as e:
             if 'unique_category_name' in str(e):
                 raise serializers.ValidationError({"name": "A category with this name already exists."})
             raise
         return category
     
     def update(self, instance, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
+        user = self.context_user
         
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         if user:
             instance.updated_by = user
-        instance.save()
+        try:
+            with transaction.atomic():
+                instance.save()
+        except IntegrityError as e:
+            if 'unique_category_name' in str(e):
+                raise serializers.ValidationError({"name": "A category with this name already exists."})
+            raise
         return instance
 
 
-class TopicSerializer(serializers.ModelSerializer):
+class TopicSerializer(ContextUserMixin, CachedFieldsMixin, serializers.ModelSerializer):
     category_uuid = serializers.UUIDField(write_only=True, required=False)
     
     class Meta:
@@ -61,65 +72,55 @@ class TopicSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({"category_uuid": "This field is required."})
         return data
     
-    def validate_name(self, value):
-        category_uuid = self.initial_data.get('category_uuid')
-        if category_uuid:
-            try:
-                category = Category.objects.get(uuid=category_uuid)
-                if self.instance is None:
-                    if Topic.objects.filter(name__iexact=value, category=category).exists():
-                        raise serializers.ValidationError("A topic with this name already exists in this category.")
-                else:
-                    if Topic.objects.filter(name__iexact=value, category=category).exclude(pk=self.instance.pk).exists():
-                        raise serializers.ValidationError("A topic with this name already exists in this category.")
-            except Category.DoesNotExist:
-                pass
-        return value
-    
     def validate_category_uuid(self, value):
         try:
-            Category.objects.get(uuid=value)
+            # Kept for create()/update() so the category is fetched once per request
+            self._category = Category.objects.get(uuid=value)
             return value
         except Category.DoesNotExist:
             raise serializers.ValidationError("Category not found.")
     
     def create(self, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
-        category_uuid = validated_data.pop('category_uuid')
-        category = Category.objects.get(uuid=category_uuid)
+        user = self.context_user
+        validated_data.pop('category_uuid')
+        category = self._category
         
         try:
-            topic = Topic.objects.create(
-                name=validated_data['name'],
-                description=validated_data.get('description', ''),
-                category=category,
-                created_by=user,
-                updated_by=user
-            )
-        except Exception as e:
+            with transaction.atomic():
+                topic = Topic.create_for_user(
+                    user,
+                    name=validated_data['name'],
+                    description=validated_data.get('description', ''),
+                    category=category
+                )
+        except IntegrityError as e:
             if 'unique_topic_name_per_category' in str(e):
                 raise serializers.ValidationError({"name": "A topic with this name already exists in this category."})
             raise
         return topic
     
     def update(self, instance, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
+        user = self.context_user
         category_uuid = validated_data.pop('category_uuid', None)
         
         if category_uuid:
-            instance.category = Category.objects.get(uuid=category_uuid)
+            instance.category = self._category
         
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         if user:
             instance.updated_by = user
-        instance.save()
+        try:
+            with transaction.atomic():
+                instance.save()
+        except IntegrityError as e:
+            if 'unique_topic_name_per_category' in str(e):
+                raise serializers.ValidationError({"name": "A topic with this name already exists in this category."})
+            raise
         return instance
 
 
-class SubtopicSerializer(serializers.ModelSerializer):
+class SubtopicSerializer(ContextUserMixin, CachedFieldsMixin, serializers.ModelSerializer):
     topic_uuid = serializers.UUIDField(write_only=True, required=False)
     
     class Meta:
@@ -132,68 +133,149 @@ class SubtopicSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({"topic_uuid": "This field is required."})
         return data
     
-    def validate_name(self, value):
-        topic_uuid = self.initial_data.get('topic_uuid')
-        if topic_uuid:
-            try:
-                topic = Topic.objects.get(uuid=topic_uuid)
-                if self.instance is None:
-                    if Subtopic.objects.filter(name__iexact=value, topic=topic).exists():
-                        raise serializers.ValidationError("A subtopic with this name already exists in this topic.")
-                else:
-                    if Subtopic.objects.filter(name__iexact=value, topic=topic).exclude(pk=self.instance.pk).exists():
-                        raise serializers.ValidationError("A subtopic with this name already exists in this topic.")
-            except Topic.DoesNotExist:
-                pass
-        return value
-    
     def validate_topic_uuid(self, value):
         try:
-            Topic.objects.get(uuid=value)
+            # Kept for create()/update() so the topic is fetched once per request
+            self._topic = Topic.objects.get(uuid=value)
             return value
         except Topic.DoesNotExist:
             raise serializers.ValidationError("Topic not found.")
     
     def create(self, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
-        topic_uuid = validated_data.pop('topic_uuid')
-        topic = Topic.objects.get(uuid=topic_uuid)
+        user = self.context_user
+        validated_data.pop('topic_uuid')
+        topic = self._topic
         
         try:
-            subtopic = Subtopic.objects.create(
-                name=validated_data['name'],
-                description=validated_data.get('description', ''),
-                topic=topic,
-                created_by=user,
-                updated_by=user
-            )
-        except Exception as e:
+            with transaction.atomic():
+                subtopic = Subtopic.create_for_user(
+                    user,
+                    name=validated_data['name'],
+                    description=validated_data.get('description', ''),
+                    topic=topic
+                )
+        except IntegrityError as e:
             if 'unique_subtopic_name_per_topic' in str(e):
                 raise serializers.ValidationError({"name": "A subtopic with this name already exists in this topic."})
             raise
         return subtopic
     
     def update(self, instance, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
+        user = self.context_user
         topic_uuid = validated_data.pop('topic_uuid', None)
         
         if topic_uuid:
-            instance.topic = Topic.objects.get(uuid=topic_uuid)
+            instance.topic = self._topic
         
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         if user:
             instance.updated_by = user
-        instance.save()
+        try:
+            with transaction.atomic():
+                instance.save()
+        except IntegrityError as e:
+            if 'unique_subtopic_name_per_topic' in str(e):
+                raise serializers.ValidationError({"name": "A subtopic with this name already exists in this topic."})
+            raise
         return instance
 
 
-class QuestionSerializer(serializers.ModelSerializer):
+# API defaults for the per-question score weights
+SCORE_WEIGHT_DEFAULTS = {
+    'score_weight_technical': 0.5,
+    'score_weight_domain_knowledge': 0.3,
+    'score_weight_communication': 0.1,
+    'score_weight_problem_solving': 0.05,
+    'score_weight_creativity': 0.05,
+    'score_weight_attention_to_detail': 0.05,
+    'score_weight_time_management': 0.05,
+    'score_weight_stress_management': 0.05,
+    'score_weight_adaptability': 0.05,
+    'score_weight_confidence': 0.05,
+}
+# API defaults for the optional Question columns (the list ones are added per call)
+QUESTION_FIELD_DEFAULTS = {
+    'description': '',
+    'difficulty_level': 'easy',
+    'expected_time_in_seconds': 60,
+    'ideal_answer_summary': '',
+    'expected_keywords_coverage': 0.1,
+    **SCORE_WEIGHT_DEFAULTS,
+}
+DUPLICATE_QUESTION_MESSAGE = 'An identical question already exists for this category, topic and subtopic.'
+
+
+class JSONListField(serializers.JSONField):
+    """
+    JSON array field.
+
+    JSONField re-encodes every input with json.dumps() to prove it is serializable;
+    a parsed JSON body already is, so only the list type is checked.
+    """
+    default_error_messages = {
+        'not_a_list': 'Expected a list of items but got type "{input_type}".'
+    }
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        return data
+
+
+class QuestionListSerializer(ContextUserMixin, serializers.ListSerializer):
+    """many=True creation: one in_bulk query per taxonomy model and a single INSERT"""
+
+    def create(self, validated_data):
+        user = self.context_user
+        
+        taxonomy = {}
+        for model, key in ((Category, 'category_uuid'), (Topic, 'topic_uuid'), (Subtopic, 'subtopic_uuid')):
+            uuids = {item[key] for item in validated_data if item.get(key)}
+            taxonomy[key] = model.objects.in_bulk(uuids, field_name='uuid') if uuids else {}
+        
+        questions = []
+        for item in validated_data:
+            related = {}
+            for field, key in (('category', 'category_uuid'), ('topic', 'topic_uuid'), ('subtopic', 'subtopic_uuid')):
+                uuid = item.get(key)
+                if not uuid:
+                    # validate() already requires the category and topic of each item
+                    if field != 'subtopic':
+                        raise serializers.ValidationError({key: "This field is required."})
+                    related[field] = None
+                elif uuid in taxonomy[key]:
+                    related[field] = taxonomy[key][uuid]
+                else:
+                    raise serializers.ValidationError({key: f"{field.capitalize()} not found."})
+            questions.append(Question(
+                created_by=user,
+                updated_by=user,
+                **related,
+                **self.child.question_fields(item)
+            ))
+        
+        try:
+            with transaction.atomic():
+                created = Question.objects.bulk_create(questions)
+        except IntegrityError as e:
+            if 'unique_question_text_per_pool' in str(e):
+                raise serializers.ValidationError({'question': DUPLICATE_QUESTION_MESSAGE})
+            raise
+        clear_list_count_cache(Question)
+        return created
+
+
+class QuestionSerializer(ContextUserMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        HundredthsField: serializers.FloatField,
+    }
     category_uuid = serializers.UUIDField(write_only=True, required=False)
     topic_uuid = serializers.UUIDField(write_only=True, required=False)
     subtopic_uuid = serializers.UUIDField(write_only=True, required=False, allow_null=True)
+    red_flags = JSONListField(required=False)
+    expected_keywords = JSONListField(required=False)
     
     class Meta:
         model = Question
@@ -209,10 +291,29 @@ class QuestionSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'uuid', 'category', 'topic', 'subtopic', 'created_at', 'updated_at']
+        list_serializer_class = QuestionListSerializer
+    
+    def validate(self, data):
+        # Also runs for every item of a many=True create
+        if self.instance is None:
+            missing = {key: "This field is required." for key in ('category_uuid', 'topic_uuid') if not data.get(key)}
+            if missing:
+                raise serializers.ValidationError(missing)
+        return data
+    
+    @staticmethod
+    def question_fields(validated_data):
+        """Column values for a new Question, with the API defaults applied"""
+        # Fresh lists per call; the uuid inputs are resolved to instances by the caller
+        fields = {**QUESTION_FIELD_DEFAULTS, 'red_flags': [], 'expected_keywords': [], **validated_data}
+        for key in ('category_uuid', 'topic_uuid', 'subtopic_uuid'):
+            fields.pop(key, None)
+        for field in SCORE_WEIGHT_DEFAULTS:
+            fields[field] = round(fields[field], 2)
+        return fields
     
     def create(self, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
+        user = self.context_user
         
         category_uuid = validated_data.pop('category_uuid', None)
         topic_uuid = validated_data.pop('topic_uuid', None)
@@ -234,38 +335,23 @@ class QuestionSerializer(serializers.ModelSerializer):
         elif 'subtopic' in validated_data:
             subtopic = validated_data.get('subtopic')
         
-        question = Question.objects.create(
-            name=validated_data['name'],
-            description=validated_data.get('description', ''),
-            category=category,
-            topic=topic,
-            subtopic=subtopic,
-            question=validated_data['question'],
-            difficulty_level=validated_data.get('difficulty_level', 'easy'),
-            expected_answer=validated_data['expected_answer'],
-            expected_time_in_seconds=validated_data.get('expected_time_in_seconds', 60),
-            ideal_answer_summary=validated_data.get('ideal_answer_summary', ''),
-            red_flags=validated_data.get('red_flags', []),
-            expected_keywords=validated_data.get('expected_keywords', []),
-            expected_keywords_coverage=validated_data.get('expected_keywords_coverage', 0.1),
-            score_weight_technical=round(validated_data.get('score_weight_technical', 0.5), 2),
-            score_weight_domain_knowledge=round(validated_data.get('score_weight_domain_knowledge', 0.3), 2),
-            score_weight_communication=round(validated_data.get('score_weight_communication', 0.1), 2),
-            score_weight_problem_solving=round(validated_data.get('score_weight_problem_solving', 0.05), 2),
-            score_weight_creativity=round(validated_data.get('score_weight_creativity', 0.05), 2),
-            score_weight_attention_to_detail=round(validated_data.get('score_weight_attention_to_detail', 0.05), 2),
-            score_weight_time_management=round(validated_data.get('score_weight_time_management', 0.05), 2),
-            score_weight_stress_management=round(validated_data.get('score_weight_stress_management', 0.05), 2),
-            score_weight_adaptability=round(validated_data.get('score_weight_adaptability', 0.05), 2),
-            score_weight_confidence=round(validated_data.get('score_weight_confidence', 0.05), 2),
-            created_by=user,
-            updated_by=user
-        )
+        try:
+            with transaction.atomic():
+                question = Question.create_for_user(
+                    user,
+                    category=category,
+                    topic=topic,
+                    subtopic=subtopic,
+                    **self.question_fields(validated_data)
+                )
+        except IntegrityError as e:
+            if 'unique_question_text_per_pool' in str(e):
+                raise serializers.ValidationError({'question': DUPLICATE_QUESTION_MESSAGE})
+            raise
         return question
     
     def update(self, instance, validated_data):
-        request = self.context.get('request')
-        user = request.user if request else None
+        user = self.context_user
         
         category_uuid = validated_data.pop('category_uuid', None)
         topic_uuid = validated_data.pop('topic_uuid', None)
@@ -281,20 +367,19 @@ class QuestionSerializer(serializers.ModelSerializer):
             else:
                 instance.subtopic = None
         
-        score_weight_fields = [
-            'score_weight_technical', 'score_weight_domain_knowledge', 'score_weight_communication',
-            'score_weight_problem_solving', 'score_weight_creativity', 'score_weight_attention_to_detail',
-            'score_weight_time_management', 'score_weight_stress_management',
-            'score_weight_adaptability', 'score_weight_confidence'
-        ]
-        
         for attr, value in validated_data.items():
-            if attr in score_weight_fields and isinstance(value, (int, float)):
+            if attr in SCORE_WEIGHT_DEFAULTS and isinstance(value, (int, float)):
                 value = round(float(value), 2)
             setattr(instance, attr, value)
         if user:
             instance.updated_by = user
-        instance.save()
+        try:
+            with transaction.atomic():
+                instance.save()
+        except IntegrityError as e:
+            if 'unique_question_text_per_pool' in str(e):
+                raise serializers.ValidationError({'question': DUPLICATE_QUESTION_MESSAGE})
+            raise
         return instance
 
 
@@ -313,6 +398,11 @@ class DifficultyPartitionSerializer(serializers.Serializer):
         return data
 
 
+def _taxonomy_columns(prefix=''):
+    """Columns generation reads from a taxonomy row and its creator: identity, name and org"""
+    return (f'{prefix}uuid', f'{prefix}name', f'{prefix}created_by', f'{prefix}created_by__organization')
+
+
 class QuestionGenerationRequestSerializer(serializers.Serializer):
     category_uuid = serializers.UUIDField(required=True)
     topic_uuid = serializers.UUIDField(required=True)
@@ -320,10 +410,66 @@ class QuestionGenerationRequestSerializer(serializers.Serializer):
     number_of_questions = serializers.IntegerField(min_value=1, max_value=1000, required=True)
     difficulty_partitions = DifficultyPartitionSerializer(required=True)
 
+    def _seed_lookups(self):
+        """
+        Load the deepest submitted node with its whole parent chain in one query.
+
+        When the submitted uuids form a consistent chain every validate_* lookup is
+        then a cache hit; anything else falls through to the per-field queries, which
+        produce the specific error messages.
+        """
+        lookups = {}
+        try:
+            subtopic_uuid = self.initial_data.get('subtopic_uuid')
+            topic_uuid = self.initial_data.get('topic_uuid')
+            if subtopic_uuid:
+                subtopic = Subtopic.objects.select_related(
+                    'created_by', 'topic__created_by', 'topic__category__created_by'
+                ).only(
+                    *_taxonomy_columns(), 'topic', *_taxonomy_columns('topic__'),
+                    'topic__category', *_taxonomy_columns('topic__category__')
+                ).filter(uuid=UUID(str(subtopic_uuid))).first()
+                topic = subtopic.topic if subtopic else None
+                if subtopic:
+                    lookups[(Subtopic, subtopic.uuid)] = subtopic
+            elif topic_uuid:
+                topic = Topic.objects.select_related(
+                    'created_by', 'category__created_by'
+                ).only(
+                    *_taxonomy_columns(), 'category', *_taxonomy_columns('category__')
+                ).filter(uuid=UUID(str(topic_uuid))).first()
+            else:
+                topic = None
+        except ValueError:
+            topic = None
+        if topic:
+            lookups[(Topic, topic.uuid)] = topic
+            lookups[(Category, topic.category.uuid)] = topic.category
+        return lookups
+
+    def _lookup(self, model, uuid, *related):
+        """Fetch a row by uuid once; the validate_* methods and the view share the instance"""
+        lookups = self.__dict__.get('_lookups')
+        if lookups is None:
+            lookups = self._lookups = self._seed_lookups()
+        if (model, uuid) not in lookups:
+            lookups[(model, uuid)] = model.objects.select_related(*related).get(uuid=uuid)
+        return lookups[(model, uuid)]
+
+    @property
+    def taxonomy(self):
+        """(category, topic, subtopic) as loaded during validation"""
+        subtopic_uuid = self.validated_data.get('subtopic_uuid')
+        return (
+            self._lookup(Category, self.validated_data['category_uuid']),
+            self._lookup(Topic, self.validated_data['topic_uuid']),
+            self._lookup(Subtopic, subtopic_uuid) if subtopic_uuid else None,
+        )
+
     def validate_category_uuid(self, value):
         try:
-            category = Category.objects.get(uuid=value)
-            if category.created_by.organization != self.context['request'].user.organization:
+            category = self._lookup(Category, value, 'created_by')
+            if category.created_by.organization_id != self.context['request'].user.organization_id:
                 raise serializers.ValidationError("Category does not belong to your organization.")
             return value
         except Category.DoesNotExist:
@@ -331,17 +477,12 @@ class QuestionGenerationRequestSerializer(serializers.Serializer):
 
     def validate_topic_uuid(self, value):
         try:
-            topic = Topic.objects.get(uuid=value)
-            if topic.created_by and topic.created_by.organization != self.context['request'].user.organization:
+            topic = self._lookup(Topic, value, 'category', 'created_by')
+            if topic.created_by and topic.created_by.organization_id != self.context['request'].user.organization_id:
                 raise serializers.ValidationError("Topic does not belong to your organization.") 
             category_uuid = self.initial_data.get('category_uuid')
-            if category_uuid:
-                try:
-                    category = Category.objects.get(uuid=category_uuid)
-                    if topic.category != category:
-                        raise serializers.ValidationError("Topic does not belong to the specified category.")
-                except Category.DoesNotExist:
-                    pass
+            if category_uuid and str(topic.category.uuid) != str(category_uuid):
+                raise serializers.ValidationError("Topic does not belong to the specified category.")
             return value
         except Topic.DoesNotExist:
             raise serializers.ValidationError("Topic not found.")
@@ -350,23 +491,18 @@ class QuestionGenerationRequestSerializer(serializers.Serializer):
         if value is None:
             return value
         try:
-            subtopic = Subtopic.objects.get(uuid=value)
-            if subtopic.created_by and subtopic.created_by.organization != self.context['request'].user.organization:
+            subtopic = self._lookup(Subtopic, value, 'topic', 'created_by')
+            if subtopic.created_by and subtopic.created_by.organization_id != self.context['request'].user.organization_id:
                 raise serializers.ValidationError("Subtopic does not belong to your organization.")
             topic_uuid = self.initial_data.get('topic_uuid')
-            if topic_uuid:
-                try:
-                    topic = Topic.objects.get(uuid=topic_uuid)
-                    if subtopic.topic != topic:
-                        raise serializers.ValidationError("Subtopic does not belong to the specified topic.")
-                except Topic.DoesNotExist:
-                    pass
+            if topic_uuid and str(subtopic.topic.uuid) != str(topic_uuid):
+                raise serializers.ValidationError("Subtopic does not belong to the specified topic.")
             return value
         except Subtopic.DoesNotExist:
             raise serializers.ValidationError("Subtopic not found.")
 
 
-class QuestionConfigurationSerializer(serializers.ModelSerializer):
+class QuestionConfigurationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = QuestionConfiguration
         fields = [
@@ -0,0 +1,41 @@
+import logging
+from typing import Dict, Optional
+from celery import shared_task
+
+from .models import QuestionConfiguration, QuestionConfigurationStatus
+from .question_generator import QuestionGenerator
+from authentication.models import User
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def generate_questions(
+    config_uuid: str,
+    category_uuid: str,
+    topic_uuid: str,
+    subtopic_uuid: Optional[str],
+    total_questions: int,
+    difficulty_partitions: Dict[str, float],
+    user_id: int
+):
+    """
+    Generate the questions of a QuestionConfiguration.
+
+    Routed to the `question_generation` queue (see CELERY_TASK_ROUTES). The
+    configuration is claimed with a conditional UPDATE first, so a task that is
+    delivered twice does not start a second run.
+    """
+    claimed = QuestionConfiguration.objects.filter(uuid=config_uuid).exclude(
+        status__in=[QuestionConfigurationStatus.IN_PROGRESS, QuestionConfigurationStatus.COMPLETED]
+    ).update(status=QuestionConfigurationStatus.IN_PROGRESS)
+    if not claimed:
+        logger.warning(f"[CONFIG {config_uuid}] Generation already running or completed, skipping")
+        return {'status': 'skipped', 'message': 'Configuration already in progress or completed'}
+
+    user = User.objects.get(pk=user_id)
+    QuestionGenerator()._generate_questions(
+        config_uuid, category_uuid, topic_uuid, subtopic_uuid,
+        total_questions, difficulty_partitions, user
+    )
+    return {'status': 'success'}
@@ -1,26 +1,103 @@
 from rest_framework import status, permissions
 from rest_framework.views import APIView
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.db import transaction
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.utils.cache import patch_cache_control
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from utils.api_response import ApiResponseBuilder
-from .models import Category, Topic, Subtopic, Question, QuestionConfiguration
+from .models import (
+    Category, Topic, Subtopic, Question, QuestionConfiguration, taxonomy_cache_version,
+    list_count_cache_version
+)
 from .serializers import (
     CategorySerializer, TopicSerializer, SubtopicSerializer,
     QuestionSerializer, QuestionGenerationRequestSerializer,
     QuestionConfigurationSerializer
 )
-from .question_generator import QuestionGenerator
+from .tasks import generate_questions
 
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Seconds a list endpoint's COUNT(*) is reused for the same filtered query
+LIST_COUNT_CACHE_TIMEOUT = 300
+
+# Seconds a serialized category/topic/subtopic list is kept; saves and deletes invalidate sooner
+TAXONOMY_LIST_CACHE_TIMEOUT = 60 * 15
+
+
+def cached_taxonomy_list(request, name, build):
+    """
+    Cache-aside for the taxonomy list endpoints.
+
+    Returns (data, etag), or (None, etag) when the client's If-None-Match already
+    matches, in which case the caller answers 304 without building anything.
+    """
+    key = f'qb:taxonomy:{taxonomy_cache_version()}:{name}'
+    etag = '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+    if etag in request.headers.get('If-None-Match', ''):
+        return None, etag
+    return cache.get_or_set(key, build, TAXONOMY_LIST_CACHE_TIMEOUT), etag
+
+
+def taxonomy_list_response(response, etag):
+    # Clients keep the list but revalidate it with If-None-Match on every use
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator whose total count comes from the cache, keyed by the SQL of the filtered
+    queryset and by the model's list count version, which saves and deletes replace
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+        version = list_count_cache_version(self.object_list.model)
+        key = f'qb:list_count:{version}:' + hashlib.blake2b(str(query).encode(), digest_size=16).hexdigest()
+        return cache.get_or_set(key, self.object_list.count, LIST_COUNT_CACHE_TIMEOUT)
+
+    def page(self, number):
+        """
+        Slice the page as a narrow primary-key scan, then fetch only those rows.
+
+        OFFSET then skips pk values instead of full-width rows. Both queries are
+        ordered with pk as a tie-breaker, so the re-fetched rows come back in page order.
+        """
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        # Widen rather than cut the slice at the count, so rows the count has not seen
+        # yet still show up on the last page
+        if top + self.orphans >= self.count:
+            top += self.orphans
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        queryset = queryset.order_by(*ordering, 'pk')
+        pks = list(queryset.values_list('pk', flat=True)[bottom:top])
+        return self._get_page(list(queryset.filter(pk__in=pks)), number, self)
+
+
 # Custom pagination
 class CustomPagination(PageNumberPagination):
+    django_paginator_class = CachedCountPaginator
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
@@ -44,8 +121,9 @@ class GenerateQuestionsView(APIView):
     
     def post(self, request):
         """Generate questions based on category, topic, and optional subtopic"""
+        role_name = request.user.role_name
         # can be done only by admin/superadmin
-        if not request.user.role.name.lower() in ['admin', 'superadmin']:
+        if role_name not in ['admin', 'superadmin']:
             return ApiResponseBuilder.error(
                 'Only admin and superadmin can generate questions',
                 status_code=status.HTTP_403_FORBIDDEN
@@ -57,7 +135,6 @@ class GenerateQuestionsView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
         
-        role_name = request.user.role.name.lower()
         if role_name not in ['admin', 'hr']:
             return ApiResponseBuilder.error(
                 'Only admin and HR users can generate questions',
@@ -79,19 +156,8 @@ class GenerateQuestionsView(APIView):
         
         validated_data = serializer.validated_data
         
-        # Get category, topic, and subtopic
-        try:
-            category = Category.objects.get(uuid=validated_data['category_uuid'])
-            topic = Topic.objects.get(uuid=validated_data['topic_uuid'])
-            subtopic = None
-            if validated_data.get('subtopic_uuid'):
-                subtopic = Subtopic.objects.get(uuid=validated_data['subtopic_uuid'])
-        except (Category.DoesNotExist, Topic.DoesNotExist, Subtopic.DoesNotExist) as e:
-            return ApiResponseBuilder.error(
-                'Category, topic, or subtopic not found',
-                str(e),
-                status_code=status.HTTP_404_NOT_FOUND
-            )
+        # Already loaded while validating the uuids
+        category, topic, subtopic = serializer.taxonomy
         
         # Create question configuration (organization-specific)
         config_name = f"{category.name} > {topic.name}"
@@ -100,28 +166,26 @@ class GenerateQuestionsView(APIView):
         config_name += f" ({validated_data['number_of_questions']} questions)"
         
         with transaction.atomic():
-            config = QuestionConfiguration.objects.create(
+            config = QuestionConfiguration.create_for_user(
+                request.user,
                 name=config_name,
                 organization=request.user.organization,
                 category=category,
                 topic=topic,
                 subtopic=subtopic,
                 number_of_questions_to_generate=validated_data['number_of_questions'],
-                number_of_questions_pending=validated_data['number_of_questions'],
-                created_by=request.user,
-                updated_by=request.user
+                number_of_questions_pending=validated_data['number_of_questions']
             )
         
         # Start background generation
-        generator = QuestionGenerator()
-        generator.generate_questions_async(
+        generate_questions.delay(
             config_uuid=str(config.uuid),
             category_uuid=str(category.uuid),
             topic_uuid=str(topic.uuid),
             subtopic_uuid=str(subtopic.uuid) if subtopic else None,
             total_questions=validated_data['number_of_questions'],
             difficulty_partitions=validated_data['difficulty_partitions'],
-            user=request.user
+            user_id=request.user.pk
         )
         
         # Return configuration status
@@ -171,19 +235,23 @@ class CategoryView(APIView):
         """Create a new category"""
         serializer = CategorySerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            category = serializer.save()
+            try:
+                serializer.save()
+            except ValidationError as e:
+                # Case-insensitive name clashes are only detected by the database constraint
+                return ApiResponseBuilder.error('Category creation failed', e.detail)
             return ApiResponseBuilder.success(
                 'Category created successfully',
-                CategorySerializer(category).data,
+                serializer.data,
                 status_code=status.HTTP_201_CREATED
             )
         return ApiResponseBuilder.error('Category creation failed', serializer.errors)
     
-    def get(self, request, category_id=None):
-        """Get category details"""
-        if category_id:
+    def get(self, request, category_uuid=None):
+        """Get category details, or all categories when no uuid is given"""
+        if category_uuid:
             try:
-                category = Category.objects.get(uuid=category_id)
+                category = Category.objects.get(uuid=category_uuid)
                 return ApiResponseBuilder.success(
                     'Category retrieved successfully',
                     CategorySerializer(category).data
@@ -193,15 +261,15 @@ class CategoryView(APIView):
                     'Category not found',
                     status_code=status.HTTP_404_NOT_FOUND
                 )
-        return ApiResponseBuilder.error('Category ID required', status_code=status.HTTP_400_BAD_REQUEST)
-
-    def get(self, request):
-        """Get all categories"""
         try:
-            categories = Category.objects.all()
-            return ApiResponseBuilder.success(
-                'Categories retrieved successfully',
-                CategorySerializer(categories, many=True).data
+            data, etag = cached_taxonomy_list(
+                request, 'categories',
+                lambda: CategorySerializer(Category.objects.all(), many=True).data
+            )
+            if data is None:
+                return taxonomy_list_response(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+            return taxonomy_list_response(
+                ApiResponseBuilder.success('Categories retrieved successfully', data), etag
             )
         except Exception as e:
             return ApiResponseBuilder.error(
@@ -210,16 +278,19 @@ class CategoryView(APIView):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
-    def put(self, request, category_id):
+    def put(self, request, category_uuid):
         """Update category"""
         try:
-            category = Category.objects.get(uuid=category_id)
+            category = Category.objects.get(uuid=category_uuid)
             serializer = CategorySerializer(category, data=request.data, partial=True)
             if serializer.is_valid():
-                category = serializer.save()
+                try:
+                    serializer.save()
+                except ValidationError as e:
+                    return ApiResponseBuilder.error('Category update failed', e.detail)
                 return ApiResponseBuilder.success(
                     'Category updated successfully',
-                    CategorySerializer(category).data
+                    serializer.data
                 )
             return ApiResponseBuilder.error('Category update failed', serializer.errors)
         except Category.DoesNotExist:
@@ -238,10 +309,14 @@ class TopicView(APIView):
         """Create a new topic"""
         serializer = TopicSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            topic = serializer.save()
+            try:
+                serializer.save()
+            except ValidationError as e:
+                # Case-insensitive name clashes are only detected by the database constraint
+                return ApiResponseBuilder.error('Topic creation failed', e.detail)
             return ApiResponseBuilder.success(
                 'Topic created successfully',
-                TopicSerializer(topic).data,
+                serializer.data,
                 status_code=status.HTTP_201_CREATED
             )
         return ApiResponseBuilder.error('Topic creation failed', serializer.errors)
@@ -268,10 +343,13 @@ class TopicView(APIView):
             topic = Topic.objects.get(uuid=topic_uuid)
             serializer = TopicSerializer(topic, data=request.data, partial=True)
             if serializer.is_valid():
-                topic = serializer.save()
+                try:
+                    serializer.save()
+                except ValidationError as e:
+                    return ApiResponseBuilder.error('Topic update failed', e.detail)
                 return ApiResponseBuilder.success(
                     'Topic updated successfully',
-                    TopicSerializer(topic).data
+                    serializer.data
                 )
             return ApiResponseBuilder.error('Topic update failed', serializer.errors)
         except Topic.DoesNotExist:
@@ -288,12 +366,17 @@ class GetTopicsByCategoryView(APIView):
     def get(self, request, category_uuid):
         """Get topics by category"""
         try:
-            topics = Topic.objects.filter(category__uuid=category_uuid)
-            return ApiResponseBuilder.success(
-                message=f'{len(topics)} topics retrieved successfully for category {category_uuid}',
-                data=TopicSerializer(topics, many=True).data,
-                status_code=status.HTTP_200_OK
+            data, etag = cached_taxonomy_list(
+                request, f'topics:{category_uuid}',
+                lambda: TopicSerializer(Topic.objects.filter(category__uuid=category_uuid), many=True).data
             )
+            if data is None:
+                return taxonomy_list_response(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+            return taxonomy_list_response(ApiResponseBuilder.success(
+                message=f'{len(data)} topics retrieved successfully for category {category_uuid}',
+                data=data,
+                status_code=status.HTTP_200_OK
+            ), etag)
         except Exception as e:
             return ApiResponseBuilder.error(
                 message=f'Error retrieving topics for category {category_uuid}',
@@ -310,10 +393,14 @@ class SubtopicView(APIView):
         """Create a new subtopic"""
         serializer = SubtopicSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            subtopic = serializer.save()
+            try:
+                serializer.save()
+            except ValidationError as e:
+                # Case-insensitive name clashes are only detected by the database constraint
+                return ApiResponseBuilder.error('Subtopic creation failed', e.detail)
             return ApiResponseBuilder.success(
                 'Subtopic created successfully',
-                SubtopicSerializer(subtopic).data,
+                serializer.data,
                 status_code=status.HTTP_201_CREATED
             )
         return ApiResponseBuilder.error('Subtopic creation failed', serializer.errors)
@@ -340,10 +427,13 @@ class SubtopicView(APIView):
             subtopic = Subtopic.objects.get(uuid=subtopic_uuid)
             serializer = SubtopicSerializer(subtopic, data=request.data, partial=True)
             if serializer.is_valid():
-                subtopic = serializer.save()
+                try:
+                    serializer.save()
+                except ValidationError as e:
+                    return ApiResponseBuilder.error('Subtopic update failed', e.detail)
                 return ApiResponseBuilder.success(
                     'Subtopic updated successfully',
-                    SubtopicSerializer(subtopic).data
+                    serializer.data
                 )
             return ApiResponseBuilder.error('Subtopic update failed', serializer.errors)
         except Subtopic.DoesNotExist:
@@ -360,12 +450,17 @@ class GetSubtopicsByTopicView(APIView):
     def get(self, request, topic_uuid):
         """Get subtopics by topic"""
         try:
-            subtopics = Subtopic.objects.filter(topic__uuid=topic_uuid)
-            return ApiResponseBuilder.success(
-                message=f'{len(subtopics)} subtopics retrieved successfully for topic {topic_uuid}',
-                data=SubtopicSerializer(subtopics, many=True).data,
-                status_code=status.HTTP_200_OK
+            data, etag = cached_taxonomy_list(
+                request, f'subtopics:{topic_uuid}',
+                lambda: SubtopicSerializer(Subtopic.objects.filter(topic__uuid=topic_uuid), many=True).data
             )
+            if data is None:
+                return taxonomy_list_response(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+            return taxonomy_list_response(ApiResponseBuilder.success(
+                message=f'{len(data)} subtopics retrieved successfully for topic {topic_uuid}',
+                data=data,
+                status_code=status.HTTP_200_OK
+            ), etag)
         except Exception as e:
             return ApiResponseBuilder.error(
                 message=f'Error retrieving subtopics for topic {topic_uuid}',
@@ -382,17 +477,23 @@ class QuestionView(APIView):
     def post(self, request):
         """Create a new question"""
         # can be done only by admin/superadmin
-        if not request.user.role.name.lower() in ['admin', 'superadmin']:
+        if request.user.role_name not in ['admin', 'superadmin']:
             return ApiResponseBuilder.error(
                 'Only admin and superadmin can create questions',
                 status_code=status.HTTP_403_FORBIDDEN
             )
-        serializer = QuestionSerializer(data=request.data, context={'request': request})
+        # A list body creates all of its questions with one INSERT
+        many = isinstance(request.data, list)
+        serializer = QuestionSerializer(data=request.data, many=many, context={'request': request})
         if serializer.is_valid():
-            question = serializer.save()
+            try:
+                serializer.save()
+            except ValidationError as e:
+                # Duplicates are only detected by the database constraint, inside save()
+                return ApiResponseBuilder.error('Question creation failed', e.detail)
             return ApiResponseBuilder.success(
-                'Question created successfully',
-                QuestionSerializer(question).data,
+                'Questions created successfully' if many else 'Question created successfully',
+                serializer.data,
                 status_code=status.HTTP_201_CREATED
             )
         return ApiResponseBuilder.error('Question creation failed', serializer.errors)
@@ -419,7 +520,7 @@ class QuestionView(APIView):
         """Update question"""
         try:
             # can be done only by admin/superadmin
-            if not request.user.role.name.lower() in ['admin', 'superadmin']:
+            if request.user.role_name not in ['admin', 'superadmin']:
                 return ApiResponseBuilder.error(
                     'Only admin and superadmin can update questions',
                     status_code=status.HTTP_403_FORBIDDEN
@@ -427,10 +528,13 @@ class QuestionView(APIView):
             question = Question.objects.get(uuid=question_uuid)
             serializer = QuestionSerializer(question, data=request.data, partial=True)
             if serializer.is_valid():
-                question = serializer.save()
+                try:
+                    serializer.save()
+                except ValidationError as e:
+                    return ApiResponseBuilder.error('Question update failed', e.detail)
                 return ApiResponseBuilder.success(
                     'Question updated successfully',
-                    QuestionSerializer(question).data
+                    serializer.data
                 )
             return ApiResponseBuilder.error('Question update failed', serializer.errors)
         except Question.DoesNotExist:
@@ -439,6 +543,18 @@ class QuestionView(APIView):
                 status_code=status.HTTP_404_NOT_FOUND
             )
 
+# Readable QuestionSerializer fields; the *_uuid ones are write-only
+QUESTION_LIST_FIELDS = tuple(
+    field for field in QuestionSerializer.Meta.fields
+    if field == 'uuid' or not field.endswith('_uuid')
+)
+
+# Columns the question list may be ordered by
+QUESTION_SORT_FIELDS = frozenset({
+    'created_at', 'updated_at', 'name', 'question', 'difficulty_level', 'expected_time_in_seconds'
+})
+
+
 # Get all questions with filteration and pagination
 @method_decorator(csrf_exempt, name='dispatch')
 class GetAllQuestionsView(APIView):
@@ -454,6 +570,7 @@ class GetAllQuestionsView(APIView):
             subtopic_uuid = request.query_params.get('subtopic_uuid', None)
             difficulty_level = request.query_params.get('difficulty_level', None)
             search = request.query_params.get('search', None)
+            keyword = request.query_params.get('keyword', None)
             sort = request.query_params.get('sort', None)
             order = request.query_params.get('order', None)
             
@@ -469,23 +586,33 @@ class GetAllQuestionsView(APIView):
             if difficulty_level:
                 filter_kwargs['difficulty_level'] = difficulty_level
             if search:
-                filter_kwargs['question__icontains'] = search
+                # LIKE on the lower-cased generated column can use question_norm_trgm;
+                # question__icontains wraps the column in UPPER() and always scans
+                filter_kwargs['question_normalized__contains'] = search.lower()
+            if keyword:
+                filter_kwargs['expected_keywords__contains'] = [keyword]
 
-            questions = Question.objects.filter(**filter_kwargs)
+            # Plain dicts in QuestionSerializer's output shape, without building model
+            # instances or running per-field serializer code for every row
+            questions = Question.objects.filter(**filter_kwargs).values(*QUESTION_LIST_FIELDS)
             
-            # Apply sorting
-            if sort:
+            # Apply sorting; without a sort field, order applies to the default created_at
+            if sort and sort not in QUESTION_SORT_FIELDS:
+                return ApiResponseBuilder.error(
+                    'Invalid sort field',
+                    f"sort must be one of: {', '.join(sorted(QUESTION_SORT_FIELDS))}",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            if sort or order:
+                sort = sort or 'created_at'
                 if order and order.lower() == 'desc':
                     sort = f'-{sort}'
                 questions = questions.order_by(sort)
-            elif order:
-                questions = questions.order_by(order)
 
             paginator = CustomPagination()
             paginated_questions = paginator.paginate_queryset(questions, request)
             
             if paginated_questions is not None:
-                serializer = QuestionSerializer(paginated_questions, many=True)
                 # Get page size from request or use default
                 try:
                     page_size = int(request.query_params.get('page_size', paginator.page_size))
@@ -497,7 +624,7 @@ class GetAllQuestionsView(APIView):
                     'page': paginator.page.number,
                     'page_size': page_size,
                     'next_page': paginator.get_next_link(),
-                    'results': serializer.data
+                    'results': paginated_questions
                 }
                 return ApiResponseBuilder.success(
                     'Questions retrieved successfully',
@@ -505,15 +632,15 @@ class GetAllQuestionsView(APIView):
                 )
             
             # If no pagination needed, return all results
-            serializer = QuestionSerializer(questions, many=True)
+            results = list(questions)
             return ApiResponseBuilder.success(
                 'Questions retrieved successfully',
                 {
-                    'total_count': questions.count(),
+                    'total_count': len(results),
                     'page': 1,
-                    'page_size': questions.count(),
+                    'page_size': len(results),
                     'next_page': None,
-                    'results': serializer.data
+                    'results': results
                 }
             )
         except Exception as e:
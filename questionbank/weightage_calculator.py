@@ -6,6 +6,27 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _compile_keyword_scanner(skill_keywords: Dict[str, List[str]]):
+    """
+    Build one regex that finds every skill keyword starting a word in a text in a single pass.
+
+    Keywords must begin at a word boundary ('api' does not match 'capital') but may run
+    into a longer word, so 'debug' still matches 'debugging'. Alternatives are tried
+    longest first inside a lookahead, so each word start reports the longest keyword
+    there; `implied` maps it to every keyword that starts a word inside it.
+    """
+    keywords = sorted(
+        {keyword.lower() for keywords in skill_keywords.values() for keyword in keywords},
+        key=len, reverse=True
+    )
+    pattern = re.compile(r'\b(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+    implied = {
+        keyword: frozenset(other for other in keywords if re.search(r'\b' + re.escape(other), keyword))
+        for keyword in keywords
+    }
+    return pattern, implied
+
+
 class WeightageCalculator:
     """Calculate score weightages for questions using formulas based on question content"""
     
@@ -68,6 +89,56 @@ class WeightageCalculator:
         ]
     }
     
+    # Per-skill multipliers for each difficulty level
+    DIFFICULTY_MULTIPLIERS = {
+        'easy': {
+            'technical': 0.8,
+            'domain_knowledge': 1.0,
+            'communication': 1.2,
+            'problem_solving': 0.7,
+            'creativity': 0.6,
+            'attention_to_detail': 0.9,
+            'time_management': 1.1,
+            'stress_management': 0.8,
+            'adaptability': 0.7,
+            'confidence': 1.2
+        },
+        'medium': {
+            'technical': 1.0,
+            'domain_knowledge': 1.0,
+            'communication': 1.0,
+            'problem_solving': 1.0,
+            'creativity': 1.0,
+            'attention_to_detail': 1.0,
+            'time_management': 1.0,
+            'stress_management': 1.0,
+            'adaptability': 1.0,
+            'confidence': 1.0
+        },
+        'hard': {
+            'technical': 1.3,
+            'domain_knowledge': 1.2,
+            'communication': 0.9,
+            'problem_solving': 1.4,
+            'creativity': 1.3,
+            'attention_to_detail': 1.1,
+            'time_management': 0.9,
+            'stress_management': 1.2,
+            'adaptability': 1.1,
+            'confidence': 0.9
+        }
+    }
+    
+    _KEYWORD_PATTERN, _IMPLIED_KEYWORDS = _compile_keyword_scanner(SKILL_KEYWORDS)
+    
+    @classmethod
+    def find_skill_keywords(cls, text_lower: str) -> set:
+        """Return the SKILL_KEYWORDS that occur in an already lower-cased text"""
+        found = set()
+        for match in cls._KEYWORD_PATTERN.finditer(text_lower):
+            found.update(cls._IMPLIED_KEYWORDS[match.group(1)])
+        return found
+    
     @staticmethod
     def calculate_keyword_density(text: str, keywords: List[str]) -> float:
         """Calculate the density of keywords in text"""
@@ -96,48 +167,10 @@ class WeightageCalculator:
         # Average complexity
         return (question_complexity + answer_complexity) / 2
     
-    @staticmethod
-    def calculate_difficulty_multiplier(difficulty: str) -> Dict[str, float]:
+    @classmethod
+    def calculate_difficulty_multiplier(cls, difficulty: str) -> Dict[str, float]:
         """Get multipliers for different skills based on difficulty"""
-        multipliers = {
-            'easy': {
-                'technical': 0.8,
-                'domain_knowledge': 1.0,
-                'communication': 1.2,
-                'problem_solving': 0.7,
-                'creativity': 0.6,
-                'attention_to_detail': 0.9,
-                'time_management': 1.1,
-                'stress_management': 0.8,
-                'adaptability': 0.7,
-                'confidence': 1.2
-            },
-            'medium': {
-                'technical': 1.0,
-                'domain_knowledge': 1.0,
-                'communication': 1.0,
-                'problem_solving': 1.0,
-                'creativity': 1.0,
-                'attention_to_detail': 1.0,
-                'time_management': 1.0,
-                'stress_management': 1.0,
-                'adaptability': 1.0,
-                'confidence': 1.0
-            },
-            'hard': {
-                'technical': 1.3,
-                'domain_knowledge': 1.2,
-                'communication': 0.9,
-                'problem_solving': 1.4,
-                'creativity': 1.3,
-                'attention_to_detail': 1.1,
-                'time_management': 0.9,
-                'stress_management': 1.2,
-                'adaptability': 1.1,
-                'confidence': 0.9
-            }
-        }
-        return multipliers.get(difficulty.lower(), multipliers['medium'])
+        return cls.DIFFICULTY_MULTIPLIERS.get(difficulty.lower(), cls.DIFFICULTY_MULTIPLIERS['medium'])
     
     @classmethod
     def calculate_weightages(
@@ -152,11 +185,13 @@ class WeightageCalculator:
         # Combine question and answer for analysis
         combined_text = f"{question} {expected_answer}"
         
-        # Calculate keyword densities for each skill
+        # Calculate keyword densities for each skill from a single scan of the text
+        found_keywords = cls.find_skill_keywords(combined_text.lower())
+        word_count = len(combined_text.split())
         skill_scores = {}
         for skill, skill_keywords in cls.SKILL_KEYWORDS.items():
-            density = cls.calculate_keyword_density(combined_text, skill_keywords)
-            skill_scores[skill] = density
+            keyword_count = sum(1 for keyword in skill_keywords if keyword in found_keywords)
+            skill_scores[skill] = keyword_count / word_count if word_count else 0.0
         
         # Calculate complexity
         complexity = cls.calculate_complexity_score(question, expected_answer)
@@ -194,8 +229,8 @@ class WeightageCalculator:
             for skill in weights:
                 weights[skill] = weights[skill] / total_weight
         else:
-            # Fallback to base weights if calculation fails
-            weights = cls.BASE_WEIGHTS.copy()
+            # Fallback to base weights if calculation fails (only read below, so no copy)
+            weights = cls.BASE_WEIGHTS
         
         # Map to model field names with 2 decimal precision
         return {
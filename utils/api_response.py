@@ -16,8 +16,6 @@ class ApiResponseBuilder:
             'status': 'success',
             'data': data
         }
-        if data:
-            response_data['data'] = data
         return Response(response_data, status=status_code)
     @staticmethod
     def error(message: str, errors: Optional[str] = None, status_code: int = status.HTTP_400_BAD_REQUEST) -> Response:
@@ -26,6 +24,4 @@ class ApiResponseBuilder:
             'status': 'error',
             'errors': errors
         }
-        if errors:
-            response_data['errors'] = errors
         return Response(response_data, status=status_code)
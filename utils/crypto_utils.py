@@ -1,62 +1,100 @@
 import os
 import hashlib
+import hmac
 import secrets
 import string
-import random
 import base64
+import functools
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+# Read once; the derived keys cached below are only valid for this value
+ENCRYPTION_PASSWORD = os.getenv('ENCRYPTION_PASSWORD', 'default-encryption-key-change-in-production').encode()
+
+PASSWORD_ALPHABET = string.ascii_letters + string.digits
+
+# Every Fernet token starts with version byte 0x80 and a big-endian timestamp, 'gAAAAA' in base64
+FERNET_TOKEN_PREFIX = b'gAAAAA'
+
+# scrypt cost for stored password hashes: 128 * n * r bytes (16 MiB) of memory per hash
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
 
 class PasswordCrypto:
     @staticmethod
     def generate_salt() -> str:
         return secrets.token_hex(32)
 
+    @staticmethod
+    def _scrypt_hash(password: str, salt: str, n: int, r: int, p: int) -> str:
+        digest = hashlib.scrypt(password.encode('utf-8'), salt=salt.encode('utf-8'), n=n, r=r, p=p, dklen=32)
+        return f'scrypt${n}${r}${p}${digest.hex()}'
+
+    @staticmethod
+    def _legacy_sha256_hash(password: str, salt: str) -> str:
+        """Hash format used before scrypt: sha256(password + salt) as hex, still accepted by verify_password."""
+        digest = hashlib.sha256(password.encode('utf-8'))
+        digest.update(salt.encode('utf-8'))
+        return digest.hexdigest()
+
     @staticmethod
     def hash_password(password: str, salt: str) -> str:
-        return hashlib.sha256(password.encode('utf-8') + salt.encode('utf-8')).hexdigest()
+        """Memory-hard scrypt hash, stored with its cost parameters as 'scrypt$n$r$p$hex'."""
+        return PasswordCrypto._scrypt_hash(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
 
     @staticmethod
     def verify_password(password: str, hashed_password: str, salt: str) -> bool:
-        return hashed_password == hashlib.sha256(password.encode('utf-8') + salt.encode('utf-8')).hexdigest()
+        if hashed_password.startswith('scrypt$'):
+            try:
+                _, n, r, p, _ = hashed_password.split('$')
+                computed = PasswordCrypto._scrypt_hash(password, salt, int(n), int(r), int(p))
+            except ValueError:
+                return False
+        else:
+            computed = PasswordCrypto._legacy_sha256_hash(password, salt)
+        # Constant-time, so response timing does not reveal how much of the hash matched
+        return hmac.compare_digest(hashed_password.encode('utf-8'), computed.encode('utf-8'))
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """True for legacy sha256 hashes and scrypt hashes made with other cost parameters."""
+        return not hashed_password.startswith(f'scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$')
 
     @staticmethod
     def generate_random_password(length: int = 12) -> str:
         """Generate a random password with letters and digits."""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return ''.join(secrets.choice(PASSWORD_ALPHABET) for _ in range(length))
     
     @staticmethod
     def _get_encryption_key(salt: str) -> bytes:
         """Derive an encryption key from salt using PBKDF2."""
-        password = os.getenv('ENCRYPTION_PASSWORD', 'default-encryption-key-change-in-production').encode()
         salt_bytes = salt.encode('utf-8')[:16]
-        
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt_bytes,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password))
-        return key
+        key = hashlib.pbkdf2_hmac('sha256', ENCRYPTION_PASSWORD, salt_bytes, 100000, 32)
+        return base64.urlsafe_b64encode(key)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_fernet(salt: str) -> Fernet:
+        """Fernet for a salt, cached so repeated encrypt/decrypt calls skip the 100k PBKDF2 rounds."""
+        return Fernet(PasswordCrypto._get_encryption_key(salt))
     
     @staticmethod
     def encrypt_password(password: str, salt: str) -> str:
         """Encrypt a password using the salt as part of the key derivation."""
-        key = PasswordCrypto._get_encryption_key(salt)
-        f = Fernet(key)
-        encrypted = f.encrypt(password.encode('utf-8'))
-        return base64.urlsafe_b64encode(encrypted).decode('utf-8')
+        f = PasswordCrypto._get_fernet(salt)
+        # A Fernet token is already URL-safe base64 text
+        return f.encrypt(password.encode('utf-8')).decode('ascii')
     
     @staticmethod
     def decrypt_password(encrypted_password: str, salt: str) -> str:
         """Decrypt a password using the salt as part of the key derivation."""
         try:
-            key = PasswordCrypto._get_encryption_key(salt)
-            f = Fernet(key)
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_password.encode('utf-8'))
-            decrypted = f.decrypt(encrypted_bytes)
+            f = PasswordCrypto._get_fernet(salt)
+            token = encrypted_password.encode('utf-8')
+            if not token.startswith(FERNET_TOKEN_PREFIX):
+                # Stored before tokens were saved as-is: base64 of the Fernet token
+                token = base64.urlsafe_b64decode(token)
+            decrypted = f.decrypt(token)
             return decrypted.decode('utf-8')
         except Exception as e:
             raise ValueError(f"Failed to decrypt password: {str(e)}")
\ No newline at end of file
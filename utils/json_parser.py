@@ -10,6 +10,28 @@ from .exceptions import JSONParseError
 
 logger = logging.getLogger(__name__)
 
+_FENCED_BLOCK_RE = re.compile(r'```(?:json)?(.*?)```', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+# A complete JSON string literal (so braces inside it are skipped), or a single brace
+_JSON_STRING_OR_BRACE_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]', re.DOTALL)
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """The first balanced {...} in text, found in one linear pass; None if there is none."""
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    for match in _JSON_STRING_OR_BRACE_RE.finditer(text, start):
+        token = match.group()
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:match.end()]
+    return None
+
 
 class JSONParser:
     """Robust JSON parser for LLM responses"""
@@ -19,13 +41,20 @@ class JSONParser:
         if not text:
             raise JSONParseError("Empty text provided")
         
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
-        if json_match:
-            return json_match.group(1).strip()
+        fenced = _FENCED_BLOCK_RE.search(text)
+        if fenced:
+            json_object = _find_json_object(fenced.group(1))
+            if json_object:
+                return json_object.strip()
+        
+        json_object = _find_json_object(text)
+        if json_object:
+            return json_object
         
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            return json_match.group(0).strip()
+        # Unbalanced (e.g. truncated) output: first '{' to last '}', for the caller's error
+        start, end = text.find('{'), text.rfind('}')
+        if start != -1 and end > start:
+            return text[start:end + 1].strip()
         
         return text.strip()
     
@@ -36,9 +65,12 @@ class JSONParser:
         
         try:
             json_text = JSONParser.extract_json(response_text)
-            json_text = json_text.replace('```json', '').replace('```', '').strip()
-            json_text = re.sub(r',(\s*[}\]])', r'\1', json_text)
-            parsed = json.loads(json_text)
+            try:
+                parsed = json.loads(json_text)
+            except json.JSONDecodeError:
+                # Models sometimes leave a trailing comma before } or ]; repair only when needed
+                json_text = _TRAILING_COMMA_RE.sub(r'\1', json_text)
+                parsed = json.loads(json_text)
             
             if not isinstance(parsed, dict):
                 raise JSONParseError(f"Expected dict, got {type(parsed)}")
@@ -0,0 +1,18 @@
+def loaded_str(instance, path='name'):
+    """
+    Value of `path` (e.g. 'name' or 'question.name') for __str__, without hitting the DB.
+
+    Deferred fields and uncached relations are never loaded just to build a display
+    string; a pk placeholder is returned instead. Code that needs the real value must
+    fetch it (include it in .only() / select_related()).
+    """
+    obj = instance
+    *relations, field = path.split('.')
+    for relation in relations:
+        if not getattr(type(obj), relation).is_cached(obj):
+            return f'<{type(instance).__name__} {instance.pk}>'
+        obj = getattr(obj, relation)
+    value = obj.__dict__.get(field)
+    if value is None:
+        return f'<{type(instance).__name__} {instance.pk}>'
+    return value
@@ -6,34 +6,7 @@ from typing import Dict
 from .prompt_sanitizer import PromptSanitizer
 
 
-class PromptBuilder:
-    """Builds prompts for LLM interactions"""
-    
-    @staticmethod
-    def build_greeting_prompt(
-        panel_name: str,
-        candidate_name: str,
-        panel_description: str,
-        total_questions: int
-    ) -> str:
-        """
-        Build prompt for greeting generation.
-        
-        Args:
-            panel_name: Name of interview panel
-            candidate_name: Name of candidate
-            panel_description: Panel description
-            total_questions: Total number of questions
-            
-        Returns:
-            Formatted prompt string
-        """
-        # Sanitize inputs
-        panel_name = PromptSanitizer.sanitize_string(panel_name, max_length=200)
-        candidate_name = PromptSanitizer.sanitize_string(candidate_name, max_length=100)
-        panel_description = PromptSanitizer.sanitize_string(panel_description or 'Technical interview assessment', max_length=500)
-        
-        prompt = f"""You are a professional interviewer conducting a technical interview.
+_GREETING_PROMPT_TEMPLATE = """You are a professional interviewer conducting a technical interview.
 
 Interview Panel Details:
 - Your Name: Vecna
@@ -53,48 +26,8 @@ The greeting should:
 
 Return ONLY the greeting text, nothing else. No prefixes, no explanations.
 """
-        return prompt
-    
-    @staticmethod
-    def build_analysis_prompt(
-        question_text: str,
-        expected_answer: str,
-        expected_keywords: list,
-        difficulty_level: str,
-        red_flags: list,
-        transcription: str,
-        questions_asked: int,
-        total_questions: int,
-        expected_keywords_coverage: float,
-        expected_time_in_seconds: int,
-        ideal_answer_summary: str,
-        total_time_taken_in_seconds: int,
-        score_weight_technical: float,
-        score_weight_domain_knowledge: float,
-        score_weight_communication: float,
-        score_weight_problem_solving: float,
-        score_weight_creativity: float,
-        score_weight_attention_to_detail: float,
-        score_weight_time_management: float,
-        score_weight_stress_management: float,
-        score_weight_adaptability: float,
-        score_weight_confidence: float
-    ) -> str:
-        # Sanitize inputs
-        question_text = PromptSanitizer.sanitize_string(question_text, max_length=1000)
-        expected_answer = PromptSanitizer.sanitize_string(expected_answer or "", max_length=2000)
-        transcription = PromptSanitizer.sanitize_transcription(transcription)
-        
-        keywords_str = ', '.join(expected_keywords[:20]) if expected_keywords else 'None'
-        red_flags_str = ', '.join(red_flags[:20]) if red_flags else 'None'
 
-        expected_technical_competency = score_weight_technical + score_weight_domain_knowledge + score_weight_problem_solving
-        expected_behavioral_and_soft_skills_competency = score_weight_communication + score_weight_creativity + score_weight_attention_to_detail + score_weight_time_management + score_weight_stress_management + score_weight_adaptability + score_weight_confidence
-        expected_psychological_traits_competency = score_weight_confidence + score_weight_stress_management
-        
-        questions_percentage = (questions_asked / total_questions * 100) if total_questions > 0 else 0
-        
-        prompt = f"""You are an expert interviewer analyzing a candidate's answer.
+_ANALYSIS_PROMPT_TEMPLATE = """You are an expert interviewer analyzing a candidate's answer.
 
 Question: {question_text}
 Expected Answer: {expected_answer}
@@ -154,5 +87,97 @@ Return your response as JSON with this structure:
 
 IMPORTANT: Only recommend "end_of_interview" if at least 50% of questions have been asked.
 """
-        return prompt
+
+
+class PromptBuilder:
+    """Builds prompts for LLM interactions"""
+    
+    @staticmethod
+    def build_greeting_prompt(
+        panel_name: str,
+        candidate_name: str,
+        panel_description: str,
+        total_questions: int
+    ) -> str:
+        """
+        Build prompt for greeting generation.
+        
+        Args:
+            panel_name: Name of interview panel
+            candidate_name: Name of candidate
+            panel_description: Panel description
+            total_questions: Total number of questions
+            
+        Returns:
+            Formatted prompt string
+        """
+        # Sanitize inputs
+        panel_name = PromptSanitizer.sanitize_string(panel_name, max_length=200)
+        candidate_name = PromptSanitizer.sanitize_string(candidate_name, max_length=100)
+        panel_description = PromptSanitizer.sanitize_string(panel_description or 'Technical interview assessment', max_length=500)
+        
+        return _GREETING_PROMPT_TEMPLATE.format_map({
+            'panel_name': panel_name,
+            'candidate_name': candidate_name,
+            'panel_description': panel_description,
+            'total_questions': total_questions
+        })
+    
+    @staticmethod
+    def build_analysis_prompt(
+        question_text: str,
+        expected_answer: str,
+        expected_keywords: list,
+        difficulty_level: str,
+        red_flags: list,
+        transcription: str,
+        questions_asked: int,
+        total_questions: int,
+        expected_keywords_coverage: float,
+        expected_time_in_seconds: int,
+        ideal_answer_summary: str,
+        total_time_taken_in_seconds: int,
+        score_weight_technical: float,
+        score_weight_domain_knowledge: float,
+        score_weight_communication: float,
+        score_weight_problem_solving: float,
+        score_weight_creativity: float,
+        score_weight_attention_to_detail: float,
+        score_weight_time_management: float,
+        score_weight_stress_management: float,
+        score_weight_adaptability: float,
+        score_weight_confidence: float
+    ) -> str:
+        # Sanitize inputs
+        question_text = PromptSanitizer.sanitize_string(question_text, max_length=1000)
+        expected_answer = PromptSanitizer.sanitize_string(expected_answer or "", max_length=2000)
+        transcription = PromptSanitizer.sanitize_transcription(transcription)
+        
+        keywords_str = ', '.join(expected_keywords[:20]) if expected_keywords else 'None'
+        red_flags_str = ', '.join(red_flags[:20]) if red_flags else 'None'
+
+        expected_technical_competency = score_weight_technical + score_weight_domain_knowledge + score_weight_problem_solving
+        expected_behavioral_and_soft_skills_competency = score_weight_communication + score_weight_creativity + score_weight_attention_to_detail + score_weight_time_management + score_weight_stress_management + score_weight_adaptability + score_weight_confidence
+        expected_psychological_traits_competency = score_weight_confidence + score_weight_stress_management
+        
+        questions_percentage = (questions_asked / total_questions * 100) if total_questions > 0 else 0
+        
+        return _ANALYSIS_PROMPT_TEMPLATE.format_map({
+            'question_text': question_text,
+            'expected_answer': expected_answer,
+            'keywords_str': keywords_str,
+            'difficulty_level': difficulty_level,
+            'red_flags_str': red_flags_str,
+            'expected_technical_competency': expected_technical_competency,
+            'expected_behavioral_and_soft_skills_competency': expected_behavioral_and_soft_skills_competency,
+            'expected_psychological_traits_competency': expected_psychological_traits_competency,
+            'expected_keywords_coverage': expected_keywords_coverage,
+            'expected_time_in_seconds': expected_time_in_seconds,
+            'ideal_answer_summary': ideal_answer_summary,
+            'transcription': transcription,
+            'total_time_taken_in_seconds': total_time_taken_in_seconds,
+            'questions_asked': questions_asked,
+            'total_questions': total_questions,
+            'questions_percentage': questions_percentage
+        })
 
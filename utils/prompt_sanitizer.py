@@ -24,9 +24,18 @@ class PromptSanitizer:
         r'\[/INST\]',
     ]
     
+    # All patterns in one case-insensitive alternation; group p<i> is INJECTION_PATTERNS[i]
+    _INJECTION_RE = re.compile(
+        '|'.join(f'(?P<p{index}>{pattern})' for index, pattern in enumerate(INJECTION_PATTERNS)),
+        re.IGNORECASE
+    )
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]')
+    
     MAX_TRANSCRIPTION_LENGTH = 10000
     
     DANGEROUS_CHARS = ['<', '>', '{', '}', '[', ']', '|']
+    _STRIP_DANGEROUS_CHARS = str.maketrans('', '', ''.join(DANGEROUS_CHARS))
     
     @classmethod
     def sanitize_transcription(cls, transcription: str) -> str:
@@ -37,21 +46,17 @@ class PromptSanitizer:
             logger.warning(f"Transcription too long ({len(transcription)} chars), truncating")
             transcription = transcription[:cls.MAX_TRANSCRIPTION_LENGTH]
         
-        transcription_lower = transcription.lower()
-        for pattern in cls.INJECTION_PATTERNS:
-            if re.search(pattern, transcription_lower, re.IGNORECASE):
-                logger.error(f"Potential prompt injection detected: {pattern}")
-                raise PromptInjectionError(
-                    f"Invalid input detected. Please provide a valid answer to the question."
-                )
-        
-        sanitized = transcription
-        for char in cls.DANGEROUS_CHARS:
-            sanitized = sanitized.replace(char, '')
+        match = cls._INJECTION_RE.search(transcription)
+        if match:
+            pattern = cls.INJECTION_PATTERNS[int(match.lastgroup[1:])]
+            logger.error(f"Potential prompt injection detected: {pattern}")
+            raise PromptInjectionError(
+                f"Invalid input detected. Please provide a valid answer to the question."
+            )
         
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+        sanitized = transcription.translate(cls._STRIP_DANGEROUS_CHARS)
         
-        return sanitized
+        return cls._collapse_whitespace(sanitized)
     
     @classmethod
     def sanitize_string(cls, text: str, max_length: int = 1000) -> str:
@@ -60,8 +65,15 @@ class PromptSanitizer:
         
         if len(text) > max_length:
             text = text[:max_length]
-        text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        if not text.isprintable():
+            text = cls._CONTROL_CHARS_RE.sub('', text)
         
-        return text
+        return cls._collapse_whitespace(text)
+    
+    @classmethod
+    def _collapse_whitespace(cls, text: str) -> str:
+        # Printable text holds no whitespace but ' ', so without a double space there is nothing to collapse
+        if text.isprintable() and '  ' not in text:
+            return text.strip()
+        return cls._WHITESPACE_RE.sub(' ', text).strip()
 
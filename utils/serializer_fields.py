@@ -0,0 +1,19 @@
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    ModelSerializer mixin that introspects the model fields once per class.
+
+    get_fields() normally rebuilds every Field from the model on each serializer
+    instantiation. The unbound result is kept on the class and every instance gets
+    a deep copy, since DRF binds (mutates) the fields it is handed.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)